@@ -0,0 +1,57 @@
+"""Compares memory used by converted configs with regular and compact (slotted, frozen) dataclasses.
+
+Run with ``PYTHONPATH=src python benchmarks/compact_memory.py``.
+"""
+import dataclasses
+import gc
+import tracemalloc
+import typing
+
+from glorpen.config.fields.simple import CollectionTypes, SimpleTypes, UnionType
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import Transformer
+
+SECTIONS = 20
+FIELDS = 10
+CONFIGS = 2000
+
+
+def create_class():
+    section = dataclasses.make_dataclass(
+        "Section", [(f"field_{i}", int, dataclasses.field(default=0)) for i in range(FIELDS)]
+    )
+    sections = [(f"section_{i}", typing.Optional[section], dataclasses.field(default=None)) for i in range(SECTIONS)]
+    return dataclasses.make_dataclass("Tenant", [("name", str)] + sections)
+
+
+def create_data(index):
+    data = dict((f"section_{i}", dict((f"field_{j}", j) for j in range(FIELDS))) for i in range(SECTIONS))
+    data["name"] = f"tenant-{index}"
+    return data
+
+
+def measure(transformer, cls, documents):
+    transformer.to_model(documents[0], cls)
+    gc.collect()
+
+    tracemalloc.start()
+    models = [transformer.to_model(data, cls) for data in documents]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del models
+    return current
+
+
+def main():
+    cls = create_class()
+    documents = [create_data(i) for i in range(CONFIGS)]
+
+    for name, compact in (("regular", False), ("compact", True)):
+        transformer = Transformer(Schema(), types=[SimpleTypes, CollectionTypes, UnionType], compact=compact)
+        used = measure(transformer, cls, documents)
+        print(f"{name:>8}: {used / 2 ** 20:8.2f} MiB, {used / CONFIGS:8.0f} B/config")
+
+
+if __name__ == "__main__":
+    main()
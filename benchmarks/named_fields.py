@@ -0,0 +1,51 @@
+"""Compares conversion of a wide dataclass with interpreted, compiled and generated converters.
+
+Run with ``PYTHONPATH=src python benchmarks/named_fields.py``.
+"""
+import dataclasses
+import timeit
+import typing
+
+from glorpen.config.fields.simple import SimpleTypes, UnionType
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import Transformer
+
+FIELDS = 150
+ROUNDS = 2000
+
+
+def create_class():
+    required = []
+    optional = []
+    for i in range(FIELDS):
+        if i % 3 == 0:
+            required.append((f"field_{i}", int))
+        elif i % 3 == 1:
+            optional.append((f"field_{i}", str, dataclasses.field(default="default")))
+        else:
+            optional.append((f"field_{i}", typing.Optional[float], dataclasses.field(default=None)))
+    return dataclasses.make_dataclass("Wide", required + optional)
+
+
+def create_transformer(**kwargs):
+    return Transformer(Schema(), types=[SimpleTypes, UnionType], **kwargs)
+
+
+def main():
+    cls = create_class()
+    data = dict((f"field_{i}", i) for i in range(FIELDS) if i % 3 != 1)
+
+    variants = {
+        "interpreted": create_transformer(compiled=False),
+        "compiled": create_transformer(),
+        "codegen": create_transformer(codegen=True),
+    }
+
+    for name, transformer in variants.items():
+        transformer.to_model(data, cls)
+        elapsed = timeit.timeit(lambda: transformer.to_model(data, cls), number=ROUNDS)
+        print(f"{name:>12}: {elapsed / ROUNDS * 1e6:8.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,28 @@
-import contextlib
+import typing
 
 from glorpen.config.model.transformer import Transformer
 from glorpen.config.model.schema import Schema
 from glorpen.config.validation import Validator
 
-
-@contextlib.contextmanager
-def _try_import():
-    try:
-        yield
-    except ImportError:
-        return
+# config types with handled types, in registration order, modules are imported when a model needs them
+_default_types = (
+    ("glorpen.config.fields.simple:UnionType", (typing.Union,)),
+    ("glorpen.config.fields.simple:SimpleTypes", (int, str, float, list, typing.Any)),
+    ("glorpen.config.fields.simple:CollectionTypes", (tuple, list, set, frozenset, dict)),
+    ("glorpen.config.fields.simple:BooleanType", (bool,)),
+    ("glorpen.config.fields.simple:PathType", ("pathlib.Path",)),
+    ("glorpen.config.fields.simple:LiteralType", (typing.Literal,)),
+    ("glorpen.config.fields.array:ArrayType", (list, "array.array", "numpy.ndarray")),
+    ("glorpen.config.fields.secret:SecretType", ("glorpen.config.fields.secret.Secret",)),
+    ("glorpen.config.fields.version:VersionType", ("semver.VersionInfo", "semver.version.Version")),
+    ("glorpen.config.fields.log:LogLevelType", ("glorpen.config.fields.log.LogLevel",)),
+)
 
 
 def default(schema: Schema = None, validator: Validator = None):
     c = Transformer(schema or Schema(), validator or Validator())
 
-    from glorpen.config.fields.simple import UnionType, SimpleTypes, CollectionTypes, BooleanType, PathType, LiteralType
-
-    c.register_type(UnionType)
-    c.register_type(SimpleTypes)
-    c.register_type(CollectionTypes)
-    c.register_type(BooleanType)
-    c.register_type(PathType)
-    c.register_type(LiteralType)
-
-    with _try_import():
-        from glorpen.config.fields.version import VersionType
-        c.register_type(VersionType)
-
-    with _try_import():
-        from glorpen.config.fields.version import VersionType
-        c.register_type(VersionType)
-
-    with _try_import():
-        from glorpen.config.fields.log import LogLevelType
-        c.register_type(LogLevelType)
+    for path, handled in _default_types:
+        c.register_lazy_type(path, handled)
 
     return c
@@ -0,0 +1,136 @@
+"""Compact numeric sequences.
+
+Fields with ``array`` option (a :mod:`array` type code) are converted to :class:`array.array`,
+or to :class:`numpy.ndarray` when NumPy is installed, in a single step instead of item by item::
+
+    weights: typing.Annotated[typing.List[float], Array("d", min=0)]
+    buckets: typing.List[int] = dataclasses.field(metadata={"array": "q", "max": 1000})
+
+Optional ``min`` and ``max`` options are checked over the whole array.
+NumPy is imported only when such field is converted.
+"""
+import array
+import functools
+import sys
+import typing
+
+from glorpen.config.model.schema import Field, Options
+from glorpen.config.model.transformer import CollectionValueError, ConfigType, ModelCompiler, add_error
+
+_TYPE_CODES = "bBhHiIlLqQfd"
+_FLOAT_CODES = "fd"
+
+
+@functools.lru_cache(maxsize=None)
+def _import_numpy():
+    """Returns :mod:`numpy` module, ``None`` if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class Array(Options):
+    """Marker for :data:`typing.Annotated` selecting array conversion."""
+
+    def __init__(self, typecode: str = "d", **options):
+        super(Array, self).__init__(array=typecode, **options)
+
+
+class ArrayType(ConfigType):
+    """Converts numeric sequences to arrays, to NumPy arrays if available unless field type is :class:`array.array`."""
+
+    handled_types = (list, array.array)
+    use_numpy = True
+
+    def handles_type(self, tp) -> bool:
+        if super(ArrayType, self).handles_type(tp):
+            return True
+        # NumPy is already imported if a model uses its types
+        numpy = sys.modules.get("numpy")
+        return numpy is not None and isinstance(tp, type) and issubclass(tp, numpy.ndarray)
+
+    def handles(self, model: Field) -> bool:
+        return super(ArrayType, self).handles(model) and bool(model.options.get("array"))
+
+    def to_model(self, data: typing.Any, model: Field):
+        if not self.handles(model):
+            return None
+        return self._convert(data, **self._get_params(model))
+
+    def compile(self, model: Field, compiler: ModelCompiler):
+        return functools.partial(self._convert, **self._get_params(model))
+
+    def _get_params(self, model: Field):
+        typecode = model.options["array"]
+        if typecode not in _TYPE_CODES:
+            raise TypeError(f"Unknown array type code {typecode!r}")
+
+        return {
+            "typecode": typecode,
+            "numpy": _import_numpy() if self.use_numpy and model.type is not array.array else None,
+            "low": model.options.get("min"),
+            "high": model.options.get("max"),
+        }
+
+    @classmethod
+    def _convert(cls, data, typecode: str, numpy, low, high):
+        if isinstance(data, (str, bytes)) or not hasattr(data, "__iter__"):
+            raise ValueError("Expected sequence of numbers")
+
+        is_float = typecode in _FLOAT_CODES
+        if numpy is not None:
+            try:
+                values = numpy.asarray(data, dtype=typecode)
+            except (TypeError, ValueError, OverflowError):
+                values = None
+            # NumPy converts None items to NaN, they are rejected item by item as without NumPy
+            if values is None or (is_float and values.ndim == 1 and numpy.isnan(values).any()):
+                values = numpy.asarray(cls._convert_items(data, typecode), dtype=typecode)
+            if values.ndim != 1:
+                raise ValueError("Expected sequence of numbers")
+        else:
+            try:
+                values = array.array(typecode, data)
+            except (TypeError, ValueError, OverflowError):
+                values = cls._convert_items(data, typecode)
+
+        if len(values) and (low is not None or high is not None):
+            # NaN compares false with everything, so it would pass both limits
+            if is_float and (numpy.isnan(values).any() if numpy is not None else any(v != v for v in values)):
+                cls._raise_out_of_range(values, lambda v: v != v, "Value is not a number")
+            smallest, largest = (values.min(), values.max()) if numpy is not None else (min(values), max(values))
+            if low is not None and smallest < low:
+                cls._raise_out_of_range(values, lambda v: v < low, f"Value is lower than {low}")
+            if high is not None and largest > high:
+                cls._raise_out_of_range(values, lambda v: v > high, f"Value is greater than {high}")
+
+        return values
+
+    @classmethod
+    def _convert_items(cls, data, typecode: str):
+        """Converts items one by one to find failing ones."""
+        conv = float if typecode in _FLOAT_CODES else int
+        values = array.array(typecode)
+        errors = {}
+
+        for index, value in enumerate(data):
+            try:
+                values.append(conv(value))
+            except (TypeError, ValueError, OverflowError) as e:
+                if add_error(errors, index, ValueError(f"{e.__class__.__name__}: {e}")):
+                    raise CollectionValueError(errors, truncated=True)
+
+        if errors:
+            raise CollectionValueError(errors)
+
+        return values
+
+    @classmethod
+    def _raise_out_of_range(cls, values, is_invalid, message: str):
+        errors = {}
+        for index, value in enumerate(values):
+            if is_invalid(value) and add_error(errors, index, ValueError(message)):
+                raise CollectionValueError(errors, truncated=True)
+        raise CollectionValueError(errors)
@@ -28,11 +28,12 @@ class LogLevelType(ConfigType):
 
     _levels = None
 
+    handled_bases = (LogLevel,)
+
     def to_model(self, data: typing.Any, model: Field):
-        if model.is_type_subclass(LogLevel):
-            value = str(data).upper()
+        value = str(data).upper()
 
-            if value in _levels.keys():
-                return _levels[value]
-            else:
-                raise ValueError(f"Not one of %r" % _levels.keys())
+        if value in _levels.keys():
+            return _levels[value]
+        else:
+            raise ValueError(f"Not one of %r" % _levels.keys())
@@ -0,0 +1,184 @@
+"""Values resolved from references, eg. ``file:///run/secrets/db_password`` or ``env:DB_PASS``.
+
+References found in a section of a document are collected during conversion and resolved together
+when the section is built, before it is validated, concurrently in a thread pool.
+Resolved values are cached for :attr:`SecretType.ttl` seconds.
+"""
+import abc
+import concurrent.futures
+import os
+import threading
+import time
+import typing
+
+from glorpen.config.model.schema import Field
+from glorpen.config.model.transformer import ConfigType, load_context
+
+_MISSING = object()
+
+
+class Secret:
+    """Referenced value, available with :meth:`get` after conversion. Value is not shown in :func:`repr`."""
+
+    __slots__ = ("reference", "_value")
+
+    def __init__(self, reference: str, value=_MISSING):
+        super(Secret, self).__init__()
+        self.reference = reference
+        self._value = value
+
+    def get(self) -> str:
+        if self._value is _MISSING:
+            raise LookupError(f"Secret {self.reference!r} was not resolved")
+        return self._value
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.reference!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Secret):
+            return NotImplemented
+        return self.reference == other.reference and self._value == other._value
+
+    def __hash__(self):
+        return hash(self.reference)
+
+
+class Backend(abc.ABC):
+    """Fetches values for references of a single scheme."""
+
+    @abc.abstractmethod
+    def fetch(self, location: str) -> str:
+        """Returns value for reference location (part after scheme), raises :class:`LookupError` or :class:`OSError`."""
+
+
+class FileBackend(Backend):
+    """Reads file contents, ``file:///path``, trailing newline is stripped."""
+
+    def fetch(self, location: str) -> str:
+        if location.startswith("//"):
+            location = location[2:]
+        with open(location, "rt") as f:
+            return f.read().rstrip("\n")
+
+
+class EnvBackend(Backend):
+    """Reads environment variables, ``env:NAME``."""
+
+    def __init__(self, environ: typing.Optional[typing.Mapping[str, str]] = None):
+        super(EnvBackend, self).__init__()
+        self.environ = os.environ if environ is None else environ
+
+    def fetch(self, location: str) -> str:
+        try:
+            return self.environ[location]
+        except KeyError:
+            raise LookupError(f"Environment variable {location} is not set") from None
+
+
+class SecretType(ConfigType):
+    """Converts references to :class:`Secret` values.
+
+    Schemes are mapped to backends in :attr:`backends`, subclass to add more.
+    """
+
+    handled_bases = (Secret,)
+
+    backends: typing.ClassVar[typing.Dict[str, Backend]] = {
+        "file": FileBackend(),
+        "env": EnvBackend(),
+    }
+    #: Seconds resolved values are reused for.
+    ttl: typing.ClassVar[float] = 300.0
+    max_workers: typing.ClassVar[typing.Optional[int]] = None
+
+    def __init__(self, converter):
+        super(SecretType, self).__init__(converter)
+        self._cache: typing.Dict[str, typing.Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def to_model(self, data: typing.Any, model: Field):
+        if isinstance(data, Secret):
+            return data
+
+        reference = str(data)
+        scheme = reference.partition(":")[0]
+        if scheme not in self.backends:
+            raise ValueError(f"Unknown reference scheme in {reference!r}")
+
+        secret = model.type(reference)
+        context = load_context.get()
+        if context is None:
+            errors = self._resolve([secret])
+            if errors:
+                raise errors[reference]
+        else:
+            pending = context.get((SecretType, "pending"), list)
+            if not pending:
+                context.defer(lambda: self._resolve_pending(context, pending))
+            pending.append(secret)
+        return secret
+
+    def _resolve_pending(self, context, pending: typing.List[Secret]):
+        secrets = pending[:]
+        pending.clear()
+        errors = self._resolve(secrets)
+        for secret in secrets:
+            if secret.reference in errors:
+                context.fail(secret, errors[secret.reference])
+
+    def _fetch(self, reference: str) -> str:
+        scheme, _, location = reference.partition(":")
+        try:
+            return self.backends[scheme].fetch(location)
+        except (LookupError, OSError) as e:
+            raise ValueError(e)
+
+    def _get_cached(self, reference: str, now: float):
+        with self._lock:
+            entry = self._cache.get(reference)
+        if entry is None or entry[0] < now:
+            return _MISSING
+        return entry[1]
+
+    def _resolve(self, secrets: typing.List[Secret]) -> typing.Dict[str, ValueError]:
+        """Sets values of secrets, returns errors of references which could not be fetched."""
+        now = time.monotonic()
+        values = {}
+        for secret in secrets:
+            if secret.reference not in values:
+                values[secret.reference] = self._get_cached(secret.reference, now)
+
+        missing = [reference for reference, value in values.items() if value is _MISSING]
+
+        def fetch(reference):
+            try:
+                return self._fetch(reference)
+            except ValueError as e:
+                return e
+
+        if len(missing) > 1:
+            with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+                results = list(executor.map(fetch, missing))
+        else:
+            results = [fetch(r) for r in missing]
+
+        errors = {}
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for reference, result in zip(missing, results):
+                if isinstance(result, ValueError):
+                    errors[reference] = result
+                else:
+                    values[reference] = result
+                    self._cache[reference] = (expires, result)
+
+        for secret in secrets:
+            if secret.reference not in errors:
+                secret._value = values[secret.reference]
+
+        return errors
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
@@ -1,24 +1,80 @@
+import functools
 import itertools
+import os
 import pathlib
 import typing
 
-from glorpen.config.model.transformer import ConfigType, CollectionValueError
+from glorpen.config.model.transformer import (
+    ConfigType, CollectionValueError, Converter, LoadContext, ModelCompiler, add_error, bulk_converter, error_budget,
+    load_context
+)
 from glorpen.config.model import schema
 
 
 class UnionType(ConfigType):
+    """Converts value to first matching union member.
+
+    When union has a :class:`glorpen.config.model.schema.Discriminator` member is selected by its tag value,
+    values without tag are converted to first matching member.
+    """
+
+    handled_types = (typing.Union,)
+
     def to_model(self, data: typing.Any, model: schema.Field):
-        if model.type is typing.Union:
-            return self._try_each_type(data, model.args)
+        converters = [functools.partial(self._converter, model=tp) for tp in model.args]
+        if model.discriminator and hasattr(data, "get"):
+            return self._select_type(data, converters, model.discriminator)
+        return self._try_each_type(data, converters)
+
+    def compile(self, model: schema.Field, compiler: ModelCompiler):
+        converters = [compiler(tp) for tp in model.args]
+        discriminator = model.discriminator
+
+        if discriminator:
+            def convert(data):
+                if hasattr(data, "get"):
+                    return self._select_type(data, converters, discriminator)
+                return self._try_each_type(data, converters)
+
+            return convert
+
+        return lambda data: self._try_each_type(data, converters)
+
+    @classmethod
+    def _select_type(cls, data, converters, discriminator: schema.Discriminator):
+        tag = data.get(discriminator.name)
+        if tag is None:
+            return cls._try_each_type(data, converters)
+
+        try:
+            index = discriminator.branches.get(tag)
+        except TypeError:
+            index = None
+
+        if index is None:
+            raise CollectionValueError({
+                discriminator.name: ValueError("Not one of: " + ', '.join(repr(t) for t in discriminator.branches))
+            })
+
+        return converters[index](data)
+
+    @classmethod
+    def _try_each_type(cls, data, converters):
+        # failed members are expected, so only failure of whole union counts towards error limit
+        budget = error_budget.get()
+        count = budget.count if budget else 0
 
-    def _try_each_type(self, data, types):
         errors = []
-        for tp in types:
+        for convert in converters:
+            if budget:
+                budget.count = count
             try:
-                return self._converter(data, tp)
+                return convert(data)
             except ValueError as e:
                 errors.append(e)
 
+        if budget:
+            budget.count = count + 1
         raise CollectionValueError(errors)
 
 
@@ -32,11 +88,33 @@ class SimpleTypes(ConfigType):
         except Exception as e:
             raise ValueError(f"{e.__class__.__name__}: {e}")
 
+    handled_types = (int, str, float, list, typing.Any)
+    bulk_types = (int, str, float)
+
+    def handles(self, model: schema.Field) -> bool:
+        # lists with declared item type are converted by CollectionTypes
+        return super(SimpleTypes, self).handles(model) and not (model.type is list and model.args)
+
     def to_model(self, data: typing.Any, model: schema.Field):
-        if model.type in (int, str, float, list):
-            return self._try_convert(data, model.type)
         if model.type is typing.Any:
             return data
+        if model.type is list and model.args:
+            return None
+        return self._try_convert(data, model.type)
+
+    def compile(self, model: schema.Field, compiler: ModelCompiler):
+        if model.type is typing.Any:
+            return lambda data: data
+
+        conv = model.type
+
+        def convert(data):
+            return self._try_convert(data, conv)
+
+        if conv in self.bulk_types:
+            convert.bulk = lambda values: list(map(conv, values))
+
+        return convert
 
 
 class BooleanType(ConfigType):
@@ -51,63 +129,246 @@ class BooleanType(ConfigType):
         True
     ]
 
+    handled_types = (bool,)
+
     def to_model(self, data: typing.Any, model: schema.Field):
-        if model.type is bool:
-            if isinstance(data, str):
-                data = data.lower()
-            return self.is_truthful(data)
+        if isinstance(data, str):
+            data = data.lower()
+        return self.is_truthful(data)
 
     def is_truthful(self, value):
         return value in self._truthful
 
 
 class CollectionTypes(ConfigType):
+    """Converts tuples and generic lists, sets, frozensets and dicts with converted items.
+
+    Items are converted in bulk when item converter supports it (see :func:`bulk_converter`),
+    conversion is retried item by item only to report errors.
+    """
+
+    handled_types = (tuple, list, set, frozenset, dict)
+
+    def handles(self, model: schema.Field) -> bool:
+        # bare collections other than tuple are left to SimpleTypes
+        return super(CollectionTypes, self).handles(model) and (model.type is tuple or bool(model.args))
+
+    @classmethod
+    def _is_variadic(cls, model: schema.Field):
+        return model.type is tuple and model.args is not None and len(model.args) == 2 \
+            and model.args[1].type is Ellipsis
+
+    @classmethod
+    def _item_fields(cls, model: schema.Field):
+        if model.args is None:
+            return []
+        if cls._is_variadic(model):
+            return model.args[:1]
+        return model.args
+
+    def _get_converter(self, model: schema.Field, converters) -> Converter:
+        if model.type is dict:
+            return functools.partial(self._convert_mapping, key=converters[0], value=converters[1])
+        if model.type is tuple and not self._is_variadic(model):
+            return functools.partial(self._convert_items, converters=converters)
+        return functools.partial(self._convert_sequence, convert=converters[0], factory=model.type)
+
     def to_model(self, data: typing.Any, model: schema.Field):
-        if model.type is tuple:
-            errors = {}
-            ret = []
+        if not self.handles(model):
+            return None
+        converters = [functools.partial(self._converter, model=f) for f in self._item_fields(model)]
+        return self._get_converter(model, converters)(data)
+
+    def compile(self, model: schema.Field, compiler: ModelCompiler):
+        return self._get_converter(model, [compiler(f) for f in self._item_fields(model)])
+
+    @classmethod
+    def _as_list(cls, data) -> list:
+        try:
+            return list(data)
+        except TypeError:
+            raise ValueError(f"Expected sequence, got {data.__class__.__name__}") from None
+
+    @classmethod
+    def _convert_items(cls, data, converters):
+        errors = {}
+        ret = []
+
+        for index, (convert, value) in enumerate(itertools.zip_longest(converters, cls._as_list(data))):
+            if convert is None:
+                error = ValueError("Extra value")
+            else:
+                try:
+                    ret.append(convert(value))
+                    continue
+                except Exception as e:
+                    error = e
+
+            if add_error(errors, index, error):
+                raise CollectionValueError(errors, truncated=True)
+
+        if errors:
+            raise CollectionValueError(errors)
+
+        return tuple(ret)
+
+    @classmethod
+    def _convert_sequence(cls, data, convert: Converter, factory):
+        values = cls._as_list(data)
+
+        bulk = bulk_converter(convert)
+        if bulk is not None:
+            try:
+                return factory(bulk(values))
+            except Exception:
+                pass
+
+        errors = {}
+        ret = []
+        for index, value in enumerate(values):
+            try:
+                ret.append(convert(value))
+            except Exception as e:
+                if add_error(errors, index, e):
+                    raise CollectionValueError(errors, truncated=True)
+
+        if errors:
+            raise CollectionValueError(errors)
 
-            for index, (field, value) in enumerate(itertools.zip_longest(model.args, data)):
+        return factory(ret)
+
+    @classmethod
+    def _convert_mapping(cls, data, key: Converter, value: Converter):
+        if not hasattr(data, "items"):
+            raise ValueError(f"Expected mapping, got {data.__class__.__name__}")
+
+        key_bulk = bulk_converter(key)
+        value_bulk = bulk_converter(value)
+        if key_bulk is not None and value_bulk is not None:
+            try:
+                return dict(zip(key_bulk(list(data.keys())), value_bulk(list(data.values()))))
+            except Exception:
+                pass
+
+        errors = {}
+        ret = {}
+        for k, v in data.items():
+            try:
+                converted_key = key(k)
+            except Exception as e:
+                error = ValueError(f"Invalid key: {e}")
+            else:
                 try:
-                    ret.append(self._converter(value, field))
+                    ret[converted_key] = value(v)
+                    continue
                 except Exception as e:
-                    errors[index] = e
+                    error = e
 
-            for i in range(len(model.args), len(data)):
-                errors[i + 1] = ValueError("Extra value")
+            if add_error(errors, k, error):
+                raise CollectionValueError(errors, truncated=True)
 
-            if errors:
-                raise CollectionValueError(errors)
+        if errors:
+            raise CollectionValueError(errors)
 
-            return tuple(ret)
+        return ret
 
 
 class LiteralType(ConfigType):
+    handled_types = (typing.Literal,)
+
     def to_model(self, data: typing.Any, model: schema.Field):
-        if model.type is typing.Literal:
-            if model.has_arg_with_type(data):
-                return data
+        if model.has_arg_with_type(data):
+            return data
 
-            raise ValueError("Not one of: " + ', '.join(repr(a) for a in model.args))
+        raise ValueError("Not one of: " + ', '.join(repr(a) for a in model.args))
 
 
 class PathType(ConfigType):
+    """Converts values to paths.
+
+    With ``expand`` option ``~`` is expanded, with ``absolute`` path is resolved and with ``existing``
+    path has to exist. Resolved directories and checked paths are cached for a single conversion.
+
+    With :attr:`deferred_checks` paths are checked at the end of conversion, concurrently in a thread pool
+    with :attr:`max_workers` threads, and all missing paths are reported in a single error.
+    """
+
+    handled_bases = (pathlib.Path,)
+
+    deferred_checks = False
+    max_workers: typing.Optional[int] = None
+
     def to_model(self, data: typing.Any, model: schema.Field):
-        if model.is_type_subclass(pathlib.Path):
-            p = pathlib.Path(data)
+        p = pathlib.Path(data)
+        context = load_context.get()
+
+        try:
+            if model.options.get("expand", False):
+                p = p.expanduser()
+            if model.options.get("absolute", False):
+                p = self._resolve(p, None if context is None else context.get((PathType, "resolved"), dict))
+        except RuntimeError as e:
+            raise ValueError(e)
+
+        if model.options.get("existing", False):
+            if context is None:
+                self._check(str(p))
+            elif self.deferred_checks:
+                context.get((PathType, "deferred"), lambda: self._defer_checks(context)).add(str(p))
+            else:
+                existing = context.get((PathType, "existing"), set)
+                key = str(p)
+                if key not in existing:
+                    self._check(key)
+                    existing.add(key)
+
+        return p
+
+    @classmethod
+    def _resolve(cls, p: pathlib.Path, resolved_dirs: typing.Optional[dict]):
+        """Resolves path, parent directories are resolved once when cache is given."""
+        if resolved_dirs is None or p.name in ("", ".."):
+            return p.resolve()
+
+        parent = str(p.parent)
+        try:
+            real_parent = resolved_dirs[parent]
+        except KeyError:
+            real_parent = resolved_dirs[parent] = os.path.realpath(parent)
+
+        path = os.path.join(real_parent, p.name)
+        if os.path.islink(path):
+            path = os.path.realpath(path)
+        return pathlib.Path(path)
+
+    @classmethod
+    def _check(cls, path: str):
+        try:
+            os.stat(path)
+        except OSError as e:
+            raise ValueError(e)
 
+    def _defer_checks(self, context: LoadContext):
+        paths = set()
+        context.on_finish(lambda: self._run_checks(paths))
+        return paths
+
+    def _run_checks(self, paths: typing.Set[str]):
+        def check(path):
             try:
-                if model.options.get("expand", False):
-                    p = p.expanduser()
-                if model.options.get("absolute", False):
-                    p = p.resolve()
-            except RuntimeError as e:
-                raise ValueError(e)
-
-            if model.options.get("existing", False):
-                try:
-                    p.resolve(True)
-                except OSError as e:
-                    raise ValueError(e)
+                self._check(path)
+            except ValueError as e:
+                return path, e
+
+        paths = sorted(paths)
+        if len(paths) > 1:
+            import concurrent.futures
+
+            with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+                results = list(executor.map(check, paths))
+        else:
+            results = [check(p) for p in paths]
 
-            return p
+        errors = dict(r for r in results if r is not None)
+        if errors:
+            raise CollectionValueError(errors)
@@ -9,6 +9,7 @@ from glorpen.config.model.schema import Field
 class VersionType(ConfigType):
     """Converts values to :class:`semver.VersionInfo`"""
 
+    handled_bases = (semver.VersionInfo,)
+
     def to_model(self, data: typing.Any, model: Field):
-        if model.is_type_subclass(semver.VersionInfo):
-            return semver.VersionInfo.parse(str(data))
+        return semver.VersionInfo.parse(str(data))
@@ -0,0 +1,63 @@
+"""Generates specialized converters for models with named fields, the same way :mod:`dataclasses` builds methods."""
+import typing
+
+from glorpen.config.model.schema import Field
+from glorpen.config.model.transformer import CollectionValueError, Converter, add_error, check_mapping
+
+
+def _field_lines(index: int, field_name: str, field: Field):
+    key = repr(field_name)
+
+    yield f"    _v = data.get({key})"
+    yield "    if _v is None:"
+    if field.is_nullable():
+        yield f"        _f{index} = None"
+    elif field.default_factory:
+        yield f"        _f{index} = _d{index}()"
+    else:
+        yield f"        _f{index} = None"
+        yield f"        if _add_error(_errors, {key}, ValueError('No value provided')):"
+        yield "            raise CollectionValueError(_errors, True)"
+    yield "    else:"
+    yield "        try:"
+    yield f"            _f{index} = _c{index}(_v)"
+    yield "        except ValueError as e:"
+    yield f"            _f{index} = None"
+    yield f"            if _add_error(_errors, {key}, e):"
+    yield "                raise CollectionValueError(_errors, True)"
+
+
+def named_fields_converter(
+        model: Field,
+        converters: typing.Dict[str, Converter],
+        build: typing.Callable[[typing.Any, dict, dict], typing.Any],
+        defaults: typing.Optional[typing.Dict[str, typing.Callable]] = None
+) -> Converter:
+    """Builds converter function for model with named fields.
+
+    ``converters`` should not handle missing values, defaults are applied by generated code
+    with field default factories or ones given in ``defaults``.
+    Instance is created by ``build`` called with data, converted field values and collected errors.
+    """
+    namespace = {
+        "_build": build,
+        "CollectionValueError": CollectionValueError,
+        "_add_error": add_error,
+        "_check_mapping": check_mapping,
+    }
+    lines = ["def convert(data):", "    _check_mapping(data)", "    _errors = {}"]
+    kwargs = []
+
+    for index, (field_name, field) in enumerate(model.args.items()):
+        namespace[f"_c{index}"] = converters[field_name]
+        namespace[f"_d{index}"] = defaults.get(field_name, field.default_factory) if defaults else field.default_factory
+        lines.extend(_field_lines(index, field_name, field))
+        kwargs.append(f"{field_name!r}: _f{index}")
+
+    lines.append(f"    return _build(data, {{{', '.join(kwargs)}}}, _errors)")
+
+    exec("\n".join(lines), namespace)
+
+    convert = namespace["convert"]
+    convert.__qualname__ = f"{model.type.__qualname__}.__glorpen_convert__"
+    return convert
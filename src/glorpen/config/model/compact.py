@@ -0,0 +1,199 @@
+"""Compact, immutable variants of schema dataclasses.
+
+Variants have the same fields and methods as original classes but use ``__slots__`` instead of instance
+dictionaries, are frozen after ``__init__`` (and ``__post_init__``) and cache their hash, so instances can be
+cheaply used as dict keys. Hash is computed over frozen field values, so collection fields are supported. Variants of dataclass bases are used as bases of variants, members of other bases
+are copied. Variants are not subclasses of original classes, abstract base classes of originals are registered
+for them so :func:`isinstance` checks against those still pass.
+"""
+import abc
+import dataclasses
+import functools
+import threading
+import types
+import typing
+
+from glorpen.config.model.schema import CLASS_CACHE_ATTRIBUTE, freeze
+
+# variants are stored on original classes, so both can be collected together
+_VARIANT = "__compact_variant__"
+_lock = threading.RLock()
+
+# members created by dataclass decorator, tied to instance dict or caching data of original class
+_SKIPPED = frozenset([
+    "__dict__", "__weakref__", "__slots__", "__annotations__",
+    "__init__", "__repr__", "__eq__", "__hash__", "__setattr__", "__delattr__",
+    "__lt__", "__le__", "__gt__", "__ge__", "__match_args__",
+    "__dataclass_fields__", "__dataclass_params__", "__getstate__", "__setstate__", _VARIANT,
+    CLASS_CACHE_ATTRIBUTE,
+])
+
+_HASH_SLOT = "_compact_hash"
+_FROZEN_SLOT = "_compact_frozen"
+
+
+def origin_class(cls: type) -> type:
+    """Returns class compact variant was created from or given class."""
+    return getattr(cls, "__compact_origin__", cls)
+
+
+def compact_class(cls: type) -> type:
+    """Returns compact variant of dataclass, variants are created once for each class."""
+    if "__compact_origin__" in cls.__dict__:
+        return cls
+
+    try:
+        return cls.__dict__[_VARIANT]
+    except KeyError:
+        pass
+
+    with _lock:
+        if _VARIANT not in cls.__dict__:
+            type.__setattr__(cls, _VARIANT, _build(cls))
+        return cls.__dict__[_VARIANT]
+
+
+def compact(value):
+    """Returns value with dataclass instances replaced by compact variants, recursively."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        if "__compact_origin__" in type(value).__dict__:
+            return value
+        return compact_class(type(value))(**dict(
+            (f.name, compact(getattr(value, f.name))) for f in dataclasses.fields(value) if f.init
+        ))
+    if type(value) is tuple:
+        return tuple(compact(v) for v in value)
+    return value
+
+
+def _restore(cls: type, values: typing.Tuple):
+    instance = object.__new__(compact_class(cls))
+    for field, value in zip(dataclasses.fields(instance), values):
+        object.__setattr__(instance, field.name, value)
+    object.__setattr__(instance, _FROZEN_SLOT, True)
+    return instance
+
+
+def _field_spec(field: dataclasses.Field):
+    kwargs = {"init": field.init, "repr": field.repr, "compare": field.compare, "metadata": field.metadata}
+    if field.default is not dataclasses.MISSING:
+        kwargs["default"] = field.default
+    if field.default_factory is not dataclasses.MISSING:
+        kwargs["default_factory"] = field.default_factory
+    return field.name, field.type, dataclasses.field(**kwargs)
+
+
+def _rebind(value, old_cls: type, new_cls: type):
+    """Returns function with ``__class__`` cell (used by zero argument ``super()``) pointing to new class."""
+    if isinstance(value, (classmethod, staticmethod)):
+        func = _rebind(value.__func__, old_cls, new_cls)
+        return value if func is value.__func__ else type(value)(func)
+    if isinstance(value, property):
+        funcs = [_rebind(f, old_cls, new_cls) if f else f for f in (value.fget, value.fset, value.fdel)]
+        return property(*funcs, value.__doc__)
+    if not isinstance(value, types.FunctionType) or "__class__" not in value.__code__.co_freevars:
+        return value
+
+    closure = list(value.__closure__)
+    index = value.__code__.co_freevars.index("__class__")
+    if closure[index].cell_contents is not old_cls:
+        return value
+    closure[index] = types.CellType(new_cls)
+
+    func = types.FunctionType(value.__code__, value.__globals__, value.__name__, value.__defaults__, tuple(closure))
+    func.__kwdefaults__ = value.__kwdefaults__
+    func.__qualname__ = value.__qualname__
+    func.__doc__ = value.__doc__
+    func.__dict__.update(value.__dict__)
+    return func
+
+
+def _setattr(self, name, value):
+    if getattr(self, _FROZEN_SLOT, False):
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+    object.__setattr__(self, name, value)
+
+
+def _delattr(self, name):
+    if getattr(self, _FROZEN_SLOT, False):
+        raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+    object.__delattr__(self, name)
+
+
+def _freezing_init(init):
+    @functools.wraps(init)
+    def __init__(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        object.__setattr__(self, _FROZEN_SLOT, True)
+
+    return __init__
+
+
+def _build(cls: type) -> type:
+    """Builds variant with compact variants of dataclass bases as bases, members of other bases are copied."""
+    fields = dataclasses.fields(cls)
+    names = tuple(f.name for f in fields)
+    hashed_names = tuple(f.name for f in fields if f.compare)
+
+    bases = tuple(compact_class(b) for b in cls.__bases__ if dataclasses.is_dataclass(b))
+    inherited = set()
+    for base in bases:
+        inherited.update(f.name for f in dataclasses.fields(base))
+
+    namespace = {}
+    sources = [b for b in cls.__bases__ if not dataclasses.is_dataclass(b)]
+    # iterated from lowest priority
+    for base in reversed([cls] + [m for b in sources for m in b.__mro__[:-1]]):
+        for key, value in base.__dict__.items():
+            if key not in _SKIPPED and key not in names:
+                namespace[key] = (base, value)
+
+    def __hash__(self):
+        try:
+            return getattr(self, _HASH_SLOT)
+        except AttributeError:
+            value = hash(tuple(freeze(getattr(self, name)) for name in hashed_names))
+            object.__setattr__(self, _HASH_SLOT, value)
+            return value
+
+    def __reduce__(self):
+        return _restore, (cls, tuple(getattr(self, name) for name in names))
+
+    members = dict((key, value) for key, (_, value) in namespace.items())
+    members.update({
+        "__hash__": __hash__,
+        "__reduce__": __reduce__,
+        "__compact_origin__": cls,
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+    })
+    if not bases:
+        members.update({"__setattr__": _setattr, "__delattr__": _delattr})
+
+    # frozen instances are emulated so __post_init__ can assign fields
+    params = cls.__dataclass_params__
+    decorated = dataclasses.make_dataclass(
+        cls.__name__, [_field_spec(f) for f in fields], bases=bases or (object,), namespace=members,
+        order=params.order
+    )
+
+    # slots cannot be declared before dataclass processing as default values are stored in class attributes
+    members = dict(decorated.__dict__)
+    for key in names + ("__dict__", "__weakref__"):
+        members.pop(key, None)
+    slots = tuple(n for n in names if n not in inherited)
+    members["__slots__"] = slots if bases else slots + (_HASH_SLOT, _FROZEN_SLOT, "__weakref__")
+    members["__init__"] = _freezing_init(members["__init__"])
+    compact = type(decorated)(decorated.__name__, decorated.__bases__, members)
+
+    for key, (owner, value) in namespace.items():
+        rebound = _rebind(value, owner, compact)
+        if rebound is not value:
+            type.__setattr__(compact, key, rebound)
+
+    for base in cls.__mro__:
+        if isinstance(base, abc.ABCMeta):
+            base.register(compact)
+
+    return compact
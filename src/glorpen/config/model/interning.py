@@ -0,0 +1,125 @@
+"""Deduplication of equal immutable values across converted configs.
+
+Strings are interned with :func:`sys.intern`. Frozen dataclasses (including compact models, see
+:mod:`glorpen.config.model.compact`) are pooled by their field values and referenced weakly, so entries
+are dropped with the last model using them. Tuples, frozensets and paths cannot be weakly referenced
+and are kept in a bounded LRU instead.
+"""
+import collections
+import dataclasses
+import pathlib
+import sys
+import threading
+import weakref
+
+InternInfo = collections.namedtuple("InternInfo", ["hits", "misses", "saved", "currsize"])
+
+
+def _typed_key(value):
+    """Returns key comparing equal only for values of the same types, ``(1,)`` and ``(True,)`` differ."""
+    tp = type(value)
+    if tp is tuple:
+        return tp, tuple(_typed_key(v) for v in value)
+    if tp is frozenset:
+        return tp, frozenset(_typed_key(v) for v in value)
+    if dataclasses.is_dataclass(tp):
+        return tp, tuple(_typed_key(getattr(value, f.name)) for f in dataclasses.fields(value))
+    return tp, value
+
+
+class InternPool:
+    """Returns previously seen values equal to given ones, ``saved`` counts bytes of dropped duplicates.
+
+    Sizes are shallow, as reported by :func:`sys.getsizeof`.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        super(InternPool, self).__init__()
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0
+
+        self._models = weakref.WeakValueDictionary()
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def intern(self, value):
+        tp = type(value)
+        if tp is str:
+            return self._intern_str(value)
+        if tp is tuple or tp is frozenset or isinstance(value, pathlib.PurePath):
+            return self._intern_value(value)
+        params = getattr(tp, "__dataclass_params__", None)
+        if params is not None and (params.frozen or "__compact_origin__" in tp.__dict__) and tp.__hash__ is not None:
+            return self._intern_model(value)
+        return value
+
+    def _hit(self, value):
+        self.hits += 1
+        self.saved += sys.getsizeof(value)
+
+    def _intern_str(self, value: str):
+        interned = sys.intern(value)
+        if interned is value:
+            self.misses += 1
+        else:
+            self._hit(value)
+        return interned
+
+    def _intern_value(self, value):
+        try:
+            key = _typed_key(value)
+            hash(key)
+        except TypeError:
+            return value
+
+        with self._lock:
+            try:
+                existing = self._values[key]
+            except KeyError:
+                self.misses += 1
+                self._values[key] = value
+                while len(self._values) > self.maxsize:
+                    self._values.popitem(last=False)
+                return value
+
+            self._values.move_to_end(key)
+            if existing is not value:
+                self._hit(value)
+            return existing
+
+    def _intern_model(self, value):
+        # key holds field values, not the model, so entry is dropped when model is collected
+        try:
+            key = _typed_key(value)
+            hash(key)
+        except TypeError:
+            return value
+
+        with self._lock:
+            existing = self._models.get(key)
+            if existing is None:
+                self.misses += 1
+                try:
+                    self._models[key] = value
+                except TypeError:
+                    # no weak reference support
+                    pass
+                return value
+
+            if existing is not value:
+                self._hit(value)
+            return existing
+
+    def info(self) -> InternInfo:
+        return InternInfo(self.hits, self.misses, self.saved, len(self._models) + len(self._values))
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+            self.saved = 0
@@ -0,0 +1,205 @@
+"""Interpolation of ``{{ path.to.value }}`` references in raw data.
+
+Templates are parsed once to segments, references are resolved in dependency order with each
+interpolated value rendered once. Input data is not modified, only containers on paths to
+interpolated values are copied.
+"""
+import functools
+import re
+import typing
+
+Path = typing.Tuple[typing.Union[str, int], ...]
+
+_pattern = re.compile(r"{{\s*([^{}\s]+)\s*}}")
+_MISSING = object()
+
+
+class Reference:
+    __slots__ = ("name", "path")
+
+    def __init__(self, name: str):
+        super(Reference, self).__init__()
+        self.name = name
+        self.path = tuple(name.split("."))
+
+
+class Template:
+    """Parsed template, segments are literal strings and references."""
+
+    __slots__ = ("segments", "references")
+
+    def __init__(self, segments: typing.Sequence[typing.Union[str, Reference]]):
+        super(Template, self).__init__()
+        self.segments = tuple(segments)
+        self.references = tuple(s for s in self.segments if isinstance(s, Reference))
+
+    def render(self, values: typing.Sequence):
+        if len(self.segments) == 1:
+            return values[0]
+
+        values = iter(values)
+        return "".join(s if isinstance(s, str) else str(next(values)) for s in self.segments)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse(text: str) -> typing.Optional[Template]:
+    """Returns template for text with references or ``None``."""
+    segments = []
+    offset = 0
+    for match in _pattern.finditer(text):
+        if match.start() > offset:
+            segments.append(text[offset:match.start()])
+        segments.append(Reference(match.group(1)))
+        offset = match.end()
+
+    if not segments:
+        return None
+    if offset < len(text):
+        segments.append(text[offset:])
+    return Template(segments)
+
+
+def _children(value):
+    if isinstance(value, dict):
+        return value.items()
+    if isinstance(value, list):
+        return enumerate(value)
+    return ()
+
+
+def _get(data, path: Path):
+    for key in path:
+        if isinstance(data, list) and isinstance(key, str) and key.isdigit():
+            key = int(key)
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return _MISSING
+    return data
+
+
+def _format_path(path: Path):
+    return ".".join(str(p) for p in path)
+
+
+class Interpolator:
+    """Resolves references in a single document."""
+
+    def __init__(self, data):
+        super(Interpolator, self).__init__()
+
+        self._data = data
+        self._templates: typing.Dict[Path, Template] = {}
+        self._nested: typing.Dict[Path, typing.List[Path]] = {}
+        self._resolved: typing.Dict[Path, typing.Any] = {}
+
+        self._collect(data, ())
+
+    def _collect(self, value, path: Path):
+        if isinstance(value, str):
+            if "{{" in value:
+                template = parse(value)
+                if template is not None:
+                    self._templates[path] = template
+                    for i in range(len(path) + 1):
+                        self._nested.setdefault(path[:i], []).append(path)
+        else:
+            for key, item in _children(value):
+                self._collect(item, path + (key,))
+
+    def _normalize(self, path: Path) -> Path:
+        """Converts list indexes in reference path to ints."""
+        ret = []
+        data = self._data
+        for key in path:
+            if isinstance(data, list) and key.isdigit():
+                key = int(key)
+            ret.append(key)
+            data = _get(data, (key,))
+        return tuple(ret)
+
+    def _build_graph(self) -> typing.Dict[Path, typing.List[Path]]:
+        """Maps each template to normalized paths it references."""
+        graph = {}
+        for path, template in self._templates.items():
+            targets = graph[path] = []
+            for reference in template.references:
+                target = self._normalize(reference.path)
+                if _get(self._data, target) is _MISSING:
+                    raise ValueError(f"Unknown reference {reference.name!r} in {_format_path(path)}")
+                targets.append(target)
+        return graph
+
+    def _order(self, graph: typing.Dict[Path, typing.List[Path]]) -> typing.List[Path]:
+        """Sorts templates so each is placed after templates it references, detecting cycles."""
+        order = []
+        done = set()
+        visiting = []
+
+        def visit(path: Path):
+            if path in done:
+                return
+            if path in visiting:
+                cycle = visiting[visiting.index(path):] + [path]
+                raise ValueError("Interpolation cycle: " + " -> ".join(_format_path(p) for p in cycle))
+
+            visiting.append(path)
+            for target in graph[path]:
+                for dependency in self._nested.get(target, ()):
+                    visit(dependency)
+            visiting.pop()
+
+            done.add(path)
+            order.append(path)
+
+        for template_path in graph.keys():
+            visit(template_path)
+
+        return order
+
+    def _value(self, path: Path):
+        """Returns referenced value with resolved templates, memoized."""
+        try:
+            return self._resolved[path]
+        except KeyError:
+            pass
+
+        value = _get(self._data, path)
+        owned = set()
+        for nested in self._nested.get(path, ()):
+            value = _set(value, nested[len(path):], self._resolved[nested], owned)
+
+        self._resolved[path] = value
+        return value
+
+    def interpolate(self):
+        if not self._templates:
+            return self._data
+
+        graph = self._build_graph()
+        for path in self._order(graph):
+            self._resolved[path] = self._templates[path].render([self._value(target) for target in graph[path]])
+
+        owned = set()
+        data = self._data
+        for path in self._templates.keys():
+            data = _set(data, path, self._resolved[path], owned)
+        return data
+
+
+def _set(data, path: Path, value, owned: typing.Set[int]):
+    """Returns data with value set at path, copying containers not created by previous calls."""
+    if not path:
+        return value
+
+    if id(data) not in owned:
+        data = data.copy()
+        owned.add(id(data))
+
+    data[path[0]] = _set(data[path[0]], path[1:], value, owned)
+    return data
+
+
+def interpolate(data):
+    """Returns data with ``{{ path.to.value }}`` references in strings replaced by referenced values."""
+    return Interpolator(data).interpolate()
@@ -0,0 +1,112 @@
+"""Lazy conversion of nested models.
+
+Nested dataclasses and large collections are stored in instances as :class:`Thunk` objects holding raw data
+and converted on first attribute access. Instances are created from subclasses of schema dataclasses,
+so they pass :func:`isinstance` checks but are not equal to eagerly converted instances.
+Pickled instances are converted and restored as instances of schema dataclasses.
+"""
+import dataclasses
+import typing
+
+from glorpen.config.model.schema import Field
+from glorpen.config.model.transformer import CollectionValueError, ConfigValueError, Converter
+
+COLLECTION_TYPES = (list, tuple, dict, set, frozenset)
+
+
+class Thunk:
+    """Raw data waiting for conversion."""
+
+    __slots__ = ("data", "convert")
+
+    def __init__(self, data, convert: Converter):
+        super(Thunk, self).__init__()
+        self.data = data
+        self.convert = convert
+
+    def resolve(self, name: str):
+        try:
+            return self.convert(self.data)
+        except ValueError as e:
+            raise ConfigValueError(CollectionValueError({name: e})) from None
+
+
+class LazyAttribute:
+    """Resolves thunk stored in instance on first access and caches the result."""
+
+    def __init__(self, name: str):
+        super(LazyAttribute, self).__init__()
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            for cls in owner.__mro__[1:]:
+                if self.name in cls.__dict__:
+                    return cls.__dict__[self.name]
+            raise AttributeError(self.name)
+
+        value = instance.__dict__[self.name]
+        if isinstance(value, Thunk):
+            value = instance.__dict__[self.name] = value.resolve(self.name)
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
+def is_lazy_field(field: Field):
+    return hasattr(field.args, "items") or field.type in COLLECTION_TYPES
+
+
+def lazy_converter(field: Field, convert: Converter, collection_size: int) -> Converter:
+    """Wraps field converter so it returns thunks for non empty values."""
+    if hasattr(field.args, "items"):
+        def convert_lazy(data):
+            if data is None:
+                return convert(data)
+            return Thunk(data, convert)
+    else:
+        def convert_lazy(data):
+            # values without length, eg. generators or invalid scalars, are converted eagerly
+            if data is None or not hasattr(data, "__len__") or len(data) < collection_size:
+                return convert(data)
+            return Thunk(data, convert)
+
+    return convert_lazy
+
+
+def _restore(cls, values: dict):
+    instance = object.__new__(cls)
+    instance.__dict__.update(values)
+    return instance
+
+
+def lazy_class(cls, names: typing.Iterable[str]):
+    """Creates subclass of dataclass with given fields converted lazily."""
+
+    # subclasses cannot be imported by name, instances are pickled as ones of original class
+    def __reduce__(self):
+        if cls.__reduce__ is not object.__reduce__:
+            return cls.__reduce__(self)
+        return _restore, (cls, dict((name, getattr(self, name)) for name in vars(self)))
+
+    namespace = dict((name, LazyAttribute(name)) for name in names)
+    namespace["__module__"] = cls.__module__
+    namespace["__qualname__"] = cls.__qualname__
+    namespace["__doc__"] = cls.__doc__
+    namespace["__reduce__"] = __reduce__
+    return type(cls.__name__, (cls,), namespace)
+
+
+def materialize(instance):
+    """Converts and validates all lazy values of given instance, recursively."""
+    if dataclasses.is_dataclass(instance) and not isinstance(instance, type):
+        for field in dataclasses.fields(instance):
+            materialize(getattr(instance, field.name))
+    elif isinstance(instance, dict):
+        for value in instance.values():
+            materialize(value)
+    elif isinstance(instance, (list, tuple, set, frozenset)):
+        for value in instance:
+            materialize(value)
+    return instance
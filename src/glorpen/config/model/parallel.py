@@ -0,0 +1,57 @@
+"""Converts many documents in worker processes.
+
+Transformers, their schemas and config types are not sent to workers, each worker builds its own
+transformer once with given factory.
+"""
+import concurrent.futures
+import functools
+import itertools
+import typing
+
+from glorpen.config.model.transformer import Transformer
+
+TransformerFactory = typing.Callable[[], Transformer]
+
+_transformer: typing.Optional[Transformer] = None
+
+
+def _init_worker(factory: TransformerFactory):
+    global _transformer
+    _transformer = factory()
+
+
+def _convert_chunk(cls, metadata, chunk: typing.List):
+    return [value for _, value in _transformer.iter_models(chunk, cls, metadata, with_errors=True)]
+
+
+def _chunks(items: typing.Iterable, size: int):
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_models(
+        factory: TransformerFactory,
+        items: typing.Iterable,
+        cls,
+        metadata=None,
+        chunk_size: int = 100,
+        max_workers: typing.Optional[int] = None,
+        mp_context=None
+) -> typing.List:
+    """Converts items with a process pool.
+
+    Returns list with a model or :class:`glorpen.config.model.transformer.ConfigValueError` for each item,
+    in input order. ``factory``, ``cls`` and ``metadata`` are pickled so should be importable module level objects.
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(factory,)
+    ) as executor:
+        results = executor.map(functools.partial(_convert_chunk, cls, metadata), _chunks(items, chunk_size))
+        return list(itertools.chain.from_iterable(results))
@@ -1,12 +1,24 @@
+import collections
+import collections.abc
 import dataclasses
+import threading
 import types
 import typing
+import weakref
 
 FieldOptions = typing.Dict[str, typing.Any]
 
 NoneType = types.NoneType if hasattr(types, "NoneType") else type(None)
 
 
+@dataclasses.dataclass
+class Discriminator:
+    """Selects union member by value of a tag field."""
+
+    name: str
+    branches: typing.Dict[typing.Any, int]
+
+
 @dataclasses.dataclass
 class Field:
     type: typing.Any
@@ -14,6 +26,7 @@ class Field:
     args: typing.Union[None, typing.Dict[str, 'Field'], typing.Sequence['Field']] = None
     default_factory: typing.Optional[typing.Callable] = None
     doc: typing.Optional[str] = None
+    discriminator: typing.Optional[Discriminator] = None
 
     def has_arg_with_type(self, data):
         for arg in self.args:
@@ -35,27 +48,238 @@ class Field:
         return self.is_nullable() or self.default_factory
 
 
+def freeze(value):
+    """Converts value to hashable form, raises :class:`TypeError` when it is not possible."""
+    if isinstance(value, dict):
+        return dict, frozenset((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(freeze(v) for v in value)
+    hash(value)
+    return value
+
+
+class Options(collections.abc.Mapping):
+    """Hashable field options, for declaring options with :data:`typing.Annotated`.
+
+    ``typing.Annotated[int, Options(min=0)]`` is the same as ``int`` with ``{"min": 0}`` metadata.
+    """
+
+    __slots__ = ("_options", "_hash")
+
+    def __init__(self, **options):
+        super(Options, self).__init__()
+        self._options = options
+        self._hash = hash(freeze(options))
+
+    def __getitem__(self, key):
+        return self._options[key]
+
+    def __iter__(self):
+        return iter(self._options)
+
+    def __len__(self):
+        return len(self._options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({', '.join(f'{k}={v!r}' for k, v in self._options.items())})"
+
+
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+CLASS_CACHE_ATTRIBUTE = "__glorpen_type_cache__"
+
+
+class TypeCache:
+    """LRU cache for values built from a type and its options.
+
+    Entries for classes are stored on the classes, keyed weakly by cache, so dynamically created classes are
+    collected together with values built from them. Only entries for other types, eg. ``list[int]`` or builtins,
+    are limited by ``maxsize``. Options that cannot be hashed bypass the cache.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        super(TypeCache, self).__init__()
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = collections.OrderedDict()
+        self._classes = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def _class_entries(self, tp, create: bool = False) -> typing.Optional[dict]:
+        """Returns entries stored on given class, ``None`` if type is not a class or does not allow attributes."""
+        if not isinstance(tp, type):
+            return None
+
+        storage = tp.__dict__.get(CLASS_CACHE_ATTRIBUTE)
+        if storage is None:
+            if not create:
+                return None
+            try:
+                type.__setattr__(tp, CLASS_CACHE_ATTRIBUTE, weakref.WeakKeyDictionary())
+            except TypeError:
+                # builtin and extension types
+                return None
+            storage = tp.__dict__[CLASS_CACHE_ATTRIBUTE]
+
+        entries = storage.get(self)
+        if entries is None and create:
+            entries = storage[self] = {}
+            self._classes.add(tp)
+        return entries
+
+    def get(self, tp, options: typing.Optional[FieldOptions], factory: typing.Callable[[], typing.Any]):
+        try:
+            frozen_options = freeze(options or {})
+            key = (tp, frozen_options)
+            hash(key)
+        except TypeError:
+            self.misses += 1
+            return factory()
+
+        with self._lock:
+            entries = self._class_entries(tp)
+            try:
+                if entries is None:
+                    value = self._entries[key]
+                    self._entries.move_to_end(key)
+                else:
+                    value = entries[frozen_options]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                return value
+
+        value = factory()
+
+        with self._lock:
+            entries = self._class_entries(tp, create=True)
+            if entries is None:
+                self._entries[key] = value
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            else:
+                entries[frozen_options] = value
+
+        return value
+
+    def info(self):
+        with self._lock:
+            size = len(self._entries) + sum(len(self._class_entries(cls) or ()) for cls in self._classes)
+        return CacheInfo(self.hits, self.misses, self.maxsize, size)
+
+    def clear(self):
+        with self._lock:
+            for cls in list(self._classes):
+                cls.__dict__[CLASS_CACHE_ATTRIBUTE].pop(self, None)
+            self._classes.clear()
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
 # TODO: ForwardRef
 
 class Schema:
+    """Builds :class:`Field` trees from types.
+
+    Generated fields are cached by type and options, returned instances are shared and should not be modified.
+    Set ``cache_size`` to ``0`` to disable caching.
+    """
+
+    def __init__(self, cache_size: int = 128):
+        super(Schema, self).__init__()
+        self._cache = TypeCache(cache_size) if cache_size else None
+
     def generate(self, tp, options=None) -> Field:
-        return self._any_to_field(tp, options or {})
+        if self._cache is None:
+            return self._any_to_field(tp, options or {})
+        return self._cache.get(tp, options, lambda: self._any_to_field(tp, options or {}))
+
+    def cache_info(self) -> typing.Optional[CacheInfo]:
+        return self._cache.info() if self._cache else None
+
+    def cache_clear(self):
+        if self._cache:
+            self._cache.clear()
 
     def _any_to_field(self, tp, options: FieldOptions):
+        if typing.get_origin(tp) is typing.Annotated:
+            tp, options = self._unpack_annotated(tp, options)
+
         if dataclasses.is_dataclass(tp):
             return self._dataclass_to_field(tp)
         else:
             return self._type_to_field(tp, options)
 
+    @classmethod
+    def _unpack_annotated(cls, tp, options: FieldOptions):
+        """Returns annotated type and options updated with mappings found in annotations."""
+        tp, *annotations = typing.get_args(tp)
+        options = dict(options)
+        for annotation in annotations:
+            if hasattr(annotation, "items"):
+                options.update(annotation.items())
+        return tp, options
+
     def _type_to_field(self, tp, options: FieldOptions):
         origin = typing.get_origin(tp)
         if origin is None:
             return Field(type=tp, options=dict(options))
         else:
-            return Field(
+            field = Field(
                 type=origin, options=dict(options),
                 args=tuple(self._any_to_field(f, options) for f in typing.get_args(tp))
             )
+            if origin is typing.Union:
+                field.discriminator = self._find_discriminator(field.args, options.get("discriminator"))
+            return field
+
+    @classmethod
+    def _get_tags(cls, member: Field, name: str):
+        if not hasattr(member.args, "items") or name not in member.args:
+            return None
+        tag = member.args[name]
+        if tag.type is not typing.Literal:
+            return None
+        return [a.type for a in tag.args]
+
+    @classmethod
+    def _find_discriminator(cls, members: typing.Sequence[Field], name: typing.Optional[str] = None):
+        """Finds tag field shared by all dataclass members of union, declared with ``discriminator`` option
+        or detected as the first required ``Literal`` field of first member."""
+        members = [(i, m) for i, m in enumerate(members) if m.type is not NoneType]
+        if not members or not all(hasattr(m.args, "items") for _, m in members):
+            if name:
+                raise TypeError(f"Discriminator {name!r} requires union of dataclasses")
+            return None
+
+        names = [name] if name else list(members[0][1].args.keys())
+        for candidate in names:
+            branches = {}
+            for index, member in members:
+                tags = cls._get_tags(member, candidate)
+                # tags with defaults can be omitted in data, so they are used only when declared
+                if tags is None or any(t in branches for t in tags) or (
+                        not name and member.args[candidate].default_factory
+                ):
+                    break
+                branches.update((t, index) for t in tags)
+            else:
+                return Discriminator(candidate, branches)
+
+        if name:
+            raise TypeError(f"Field {name!r} is not a discriminator with unique Literal values in each union member")
+        return None
 
     @classmethod
     def _get_default_factory(cls, field: dataclasses.Field):
@@ -1,18 +1,46 @@
 import abc
+import contextvars
 import dataclasses
+import functools
+import importlib
 import textwrap
 import typing
 
-from glorpen.config.model.schema import Field, Schema
+from glorpen.config.model import compact
+from glorpen.config.model.schema import Field, NoneType, Schema, TypeCache
 from glorpen.config.validation import Validator
 
+if typing.TYPE_CHECKING:
+    import asyncio
+
+    from glorpen.config.model.interning import InternPool
+
 
 class DataConverter(typing.Protocol):
     def __call__(self, data: typing.Any, model: Field):
         pass
 
 
+Converter = typing.Callable[[typing.Any], typing.Any]
+ModelCompiler = typing.Callable[[Field], Converter]
+AsyncConverter = typing.Callable[[typing.Any, "asyncio.Semaphore"], typing.Awaitable[typing.Any]]
+
+
 class ConfigType(abc.ABC):
+    """Converts data to models.
+
+    Types declaring :attr:`handled_types` or :attr:`handled_bases` are called only for matching models,
+    types declaring nothing are probed with each value and should return ``None`` for unsupported models.
+
+    Types can additionally define coroutine ``to_model_async(data, model)`` used by
+    :meth:`Transformer.to_model_async` for fields of dataclasses and top level values.
+    """
+
+    #: Exact values of :attr:`Field.type`, eg. ``int`` or ``typing.Union`` origin.
+    handled_types: typing.ClassVar[typing.Tuple[typing.Any, ...]] = ()
+    #: Classes which subclasses are handled.
+    handled_bases: typing.ClassVar[typing.Tuple[type, ...]] = ()
+
     def __init__(self, converter: DataConverter):
         super(ConfigType, self).__init__()
         self._converter = converter
@@ -21,22 +49,88 @@ class ConfigType(abc.ABC):
     def to_model(self, data: typing.Any, model: Field):
         pass
 
+    def handles_type(self, tp) -> typing.Optional[bool]:
+        """Checks given :attr:`Field.type` against declared types, ``None`` if type declares nothing."""
+        if not (self.handled_types or self.handled_bases):
+            return None
+        return tp in self.handled_types or (isinstance(tp, type) and issubclass(tp, self.handled_bases))
+
+    def handles(self, model: Field) -> typing.Optional[bool]:
+        """Tells if model is handled by this type without looking at data.
+
+        Returns ``None`` when it cannot be decided up front, model is then probed with each value.
+        """
+        return self.handles_type(model.type)
+
+    def compile(self, model: Field, compiler: ModelCompiler) -> Converter:
+        """Builds converter for model handled by this type, nested models can be built with ``compiler``."""
+        return functools.partial(self.to_model, model=model)
+
 
 ValueErrorItems = typing.Union[dict, typing.Sequence]
 
 
+class LazyType:
+    """Config type registered by import path, ``"module:Class"``, imported when a model first needs it.
+
+    Handled types are matched exactly or as base classes. They can be given as ``"module.QualifiedName"``
+    strings matched by name against classes in type MRO, so their modules are not imported either.
+    Declared types should include all types handled by the config type.
+    """
+
+    __slots__ = ("path", "types", "names")
+
+    def __init__(self, path: str, handled: typing.Iterable[typing.Any]):
+        super(LazyType, self).__init__()
+        self.path = path
+        self.types = tuple(t for t in handled if not isinstance(t, str))
+        self.names = frozenset(t for t in handled if isinstance(t, str))
+
+    def matches(self, tp) -> bool:
+        if tp in self.types:
+            return True
+        if isinstance(tp, type):
+            for base in tp.__mro__:
+                if base in self.types or f"{base.__module__}.{base.__qualname__}" in self.names:
+                    return True
+        return False
+
+    def load(self) -> typing.Type[ConfigType]:
+        module, _, name = self.path.partition(":")
+        return getattr(importlib.import_module(module), name)
+
+
 class ConfigValueError(ValueError):
     def __init__(self, error):
-        super(ConfigValueError, self).__init__(f"Found validation errors:\n{error}")
+        super(ConfigValueError, self).__init__(error)
+        self.error = error
+
+    def __str__(self):
+        return f"Found validation errors:\n{self.error}"
+
+    def __reduce__(self):
+        return self.__class__, (self.error,)
 
 
 class CollectionValueError(ValueError):
-    def __init__(self, items: ValueErrorItems):
-        msg = self._format_row(items)
-        super(CollectionValueError, self).__init__(msg)
+    """Errors of collection items, keyed by field name or index.
 
-    def _format_row(self, items: ValueErrorItems):
-        return textwrap.indent("\n".join(self._format_items(items)), "")
+    Message is formatted only when error is converted to string.
+    """
+
+    def __init__(self, items: ValueErrorItems, truncated: bool = False):
+        super(CollectionValueError, self).__init__(items)
+        self.items = items
+        self.truncated = truncated
+
+    def __str__(self):
+        msg = "\n".join(self._format_items(self.items))
+        if self.truncated:
+            msg += "\n(error limit reached)"
+        return msg
+
+    def __reduce__(self):
+        return self.__class__, (self.items, self.truncated)
 
     @classmethod
     def _format_items(cls, items: ValueErrorItems):
@@ -57,50 +151,608 @@ class CollectionValueError(ValueError):
             yield f"{f_key}{key_suffix}{f_msg}"
 
 
+class ErrorBudget:
+    """Counts errors found during a single conversion."""
+
+    __slots__ = ("limit", "count")
+
+    def __init__(self, limit: int):
+        super(ErrorBudget, self).__init__()
+        self.limit = limit
+        self.count = 0
+
+    def add(self, error: ValueError) -> bool:
+        if not isinstance(error, CollectionValueError):
+            self.count += 1
+        return self.count >= self.limit
+
+
+error_budget: contextvars.ContextVar[typing.Optional[ErrorBudget]] = contextvars.ContextVar(
+    "error_budget", default=None
+)
+
+
+class LoadContext:
+    """State shared by config types during a single conversion.
+
+    Types can keep per-load caches with :meth:`get` and register callbacks run after the whole value was converted,
+    eg. to check collected values in batch. Callbacks can raise :class:`ValueError` to fail the conversion.
+    Values that are not usable until processed in batch should be registered with :meth:`defer` instead,
+    deferred callbacks are run when enclosing model is built, so before validators see the values.
+    Values they could not process are reported with :meth:`fail`, errors are then raised for fields holding them.
+    """
+
+    __slots__ = ("_state", "_callbacks", "_deferred", "_failures")
+
+    def __init__(self):
+        super(LoadContext, self).__init__()
+        self._state = {}
+        self._callbacks = []
+        self._deferred = []
+        self._failures = {}
+
+    def get(self, key, factory: typing.Callable[[], typing.Any]):
+        """Returns state stored under key, creating it with factory on first use."""
+        try:
+            return self._state[key]
+        except KeyError:
+            value = self._state[key] = factory()
+            return value
+
+    def on_finish(self, callback: typing.Callable[[], None]):
+        self._callbacks.append(callback)
+
+    def defer(self, callback: typing.Callable[[], None]):
+        """Registers callback run on next :meth:`flush`, when enclosing model is built or at finish."""
+        self._deferred.append(callback)
+
+    def fail(self, value, error: ValueError):
+        """Reports value deferred callback could not process."""
+        self._failures[id(value)] = (value, error)
+
+    def flush(self):
+        while self._deferred:
+            deferred, self._deferred = self._deferred, []
+            for callback in deferred:
+                callback()
+
+    def pop_failures(self, values: typing.Mapping) -> typing.Dict[typing.Any, ValueError]:
+        """Returns errors of failed values found in given mapping, directly or as items of collections."""
+        errors = {}
+        if not self._failures:
+            return errors
+
+        for key, value in values.items():
+            if id(value) in self._failures:
+                errors[key] = self._failures.pop(id(value))[1]
+            elif isinstance(value, (list, tuple, dict)):
+                items = value if isinstance(value, dict) else dict(enumerate(value))
+                item_errors = self.pop_failures(items)
+                if item_errors:
+                    errors[key] = CollectionValueError(item_errors)
+        return errors
+
+    def finish(self):
+        self.flush()
+        if self._failures:
+            # values not held by any model field, eg. converted at top level
+            errors = [error for _, error in self._failures.values()]
+            raise errors[0] if len(errors) == 1 else CollectionValueError(errors)
+        for callback in self._callbacks:
+            callback()
+
+
+load_context: contextvars.ContextVar[typing.Optional[LoadContext]] = contextvars.ContextVar(
+    "load_context", default=None
+)
+
+
+def add_error(errors: dict, key, error: ValueError) -> bool:
+    """Stores collection item error, tells if conversion should stop because error limit was reached."""
+    errors[key] = error
+    budget = error_budget.get()
+    return budget is not None and budget.add(error)
+
+
+def convert_fields(
+        data, fields: typing.Iterable[typing.Tuple[str, Converter]], kwargs: dict, errors: dict
+):
+    """Converts values of named fields found in data mapping to kwargs, collecting errors of failing ones."""
+    for field_name, convert_field in fields:
+        try:
+            kwargs[field_name] = convert_field(data.get(field_name))
+        except ValueError as e:
+            if add_error(errors, field_name, e):
+                raise CollectionValueError(errors, truncated=True)
+
+
+def is_same_data(a, b) -> bool:
+    """Compares raw data by value and type, so eg. ``1``, ``1.0`` and ``True`` are different."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(is_same_data(v, b[k]) for k, v in a.items())
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(is_same_data(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def check_mapping(data):
+    """Raises :class:`ValueError` if data cannot be converted to model with named fields."""
+    if not hasattr(data, "items"):
+        raise ValueError(f"Expected mapping, got {data.__class__.__name__}")
+
+
+def bulk_converter(convert: Converter) -> typing.Optional[typing.Callable[[list], list]]:
+    """Returns function converting list of values at once, if converter provides one.
+
+    Bulk functions are set as ``bulk`` attribute of converters and may raise any exception,
+    callers should then convert values one by one to find failing ones.
+    """
+    return getattr(convert, "bulk", None)
+
+
+def iter_errors(error: ValueError, path: typing.Tuple = ()) -> typing.Iterator[typing.Tuple[typing.Tuple, ValueError]]:
+    """Yields paths and errors found in nested named collection errors."""
+    if isinstance(error, ConfigValueError):
+        error = error.error
+    if isinstance(error, CollectionValueError) and hasattr(error.items, "items"):
+        for key, item in error.items.items():
+            yield from iter_errors(item, path + (key,))
+    else:
+        yield path, error
+
+
 class Transformer:
-    """Config normalizer."""
+    """Config normalizer.
+
+    By default models are compiled once to converter plans and cached, set ``compiled`` to ``False``
+    to interpret models on each conversion. With ``codegen`` models with named fields are compiled
+    to generated functions, see :mod:`glorpen.config.model.codegen`.
+
+    With ``lazy`` nested dataclasses and collections with at least :attr:`lazy_collection_size` items
+    are converted on first access, see :mod:`glorpen.config.model.lazy`. Requires compiled plans.
+
+    With ``interpolation`` references like ``{{ path.to.value }}`` in raw data are resolved before conversion,
+    see :mod:`glorpen.config.model.interpolation`.
+
+    Conversion stops after ``max_errors`` errors or on first one with ``fail_fast``.
+
+    With ``compact`` dataclasses are created as slotted, frozen variants with cached hash,
+    see :mod:`glorpen.config.model.compact`.
+
+    With ``interning`` equal strings and immutable values are shared between converted models,
+    a :class:`glorpen.config.model.interning.InternPool` can be given to share it between transformers.
+    """
+
+    lazy_collection_size = 1000
+    #: Default limit of concurrently awaited ``to_model_async`` calls.
+    async_concurrency = 16
 
     _validator: typing.Optional[Validator]
-    _registered_types: typing.List[ConfigType]
+    _registered_types: typing.List[typing.Union[ConfigType, LazyType]]
+    _dispatch: typing.Dict[typing.Any, typing.Tuple[ConfigType, ...]]
+    _plans: typing.Optional[TypeCache]
 
     def __init__(self, schema: Schema,
                  validator: typing.Optional[Validator] = None,
-                 types: typing.Optional[typing.Iterable[typing.Type[ConfigType]]] = None):
+                 types: typing.Optional[typing.Iterable[typing.Type[ConfigType]]] = None,
+                 compiled: bool = True,
+                 codegen: bool = False,
+                 lazy: bool = False,
+                 interpolation: bool = False,
+                 fail_fast: bool = False,
+                 max_errors: typing.Optional[int] = None,
+                 compact: bool = False,
+                 interning: typing.Union[bool, "InternPool"] = False):
         super(Transformer, self).__init__()
 
         self._schema = schema
         self._registered_types = []
+        self._dispatch = {}
         self._validator = validator
+        self._plans = TypeCache() if compiled else None
+        self._async_plans = TypeCache()
+        self._codegen = codegen
+        self._lazy = lazy
+        self._interpolation = interpolation
+        self._max_errors = 1 if fail_fast else max_errors
+        self._compact = compact
+        if interning is True:
+            from glorpen.config.model.interning import InternPool
+            self._intern_pool = InternPool()
+        else:
+            self._intern_pool = interning or None
+
+        if lazy and not compiled:
+            raise ValueError("Lazy conversion requires compiled plans")
+        if lazy and compact:
+            raise ValueError("Lazy conversion cannot be used with compact models")
 
         if types:
             for t in types:
                 self.register_type(t)
 
-    @classmethod
-    def _handle_optional_values(cls, model: Field):
+    def _handle_optional_values(self, model: Field):
         if model.is_nullable():
             return None
         if model.default_factory:
-            return model.default_factory()
+            return self._get_default(model)
 
         raise ValueError("No value provided")
 
+    def _get_default(self, model: Field):
+        value = model.default_factory()
+        if self._compact:
+            return compact.compact(value)
+        return value
+
+    def _instance_class(self, cls):
+        if self._compact:
+            return compact.compact_class(cls)
+        return cls
+
     def _as_model(self, data: typing.Any, model: Field):
         if data is None:
             return self._handle_optional_values(model)
 
         if hasattr(model.args, "items"):
-            return self._from_named_fields(data, model)
+            value = self._from_named_fields(data, model)
+        else:
+            value = self._from_type(data, model)
+
+        if self._intern_pool is not None:
+            return self._intern_pool.intern(value)
+        return value
+
+    def _converter_for(self, cls, metadata=None) -> Converter:
+        if self._plans is None:
+            convert = functools.partial(self._as_model, model=self._schema.generate(cls, metadata))
         else:
-            return self._from_type(data, model)
+            convert = self._plans.get(cls, metadata, lambda: self.compile(self._schema.generate(cls, metadata)))
+
+        if self._interpolation:
+            convert = self._with_interpolation(convert)
+        if self._max_errors:
+            convert = functools.partial(self._convert_with_budget, convert)
+        return functools.partial(self._convert_in_context, convert)
+
+    @classmethod
+    def _with_interpolation(cls, convert: Converter) -> Converter:
+        from glorpen.config.model.interpolation import interpolate
+        return lambda data: convert(interpolate(data))
+
+    def _convert_with_budget(self, convert: Converter, data):
+        token = error_budget.set(ErrorBudget(self._max_errors))
+        try:
+            return convert(data)
+        finally:
+            error_budget.reset(token)
+
+    @classmethod
+    def _convert_in_context(cls, convert: Converter, data):
+        context = LoadContext()
+        token = load_context.set(context)
+        try:
+            value = convert(data)
+            context.finish()
+            return value
+        finally:
+            load_context.reset(token)
 
     def to_model(self, data, cls, metadata=None):
-        model = self._schema.generate(cls, metadata)
+        convert = self._converter_for(cls, metadata)
+        try:
+            return convert(data)
+        except ValueError as e:
+            raise ConfigValueError(e) from None
+
+    async def to_model_async(self, data, cls, metadata=None, concurrency: typing.Optional[int] = None):
+        """Converts data awaiting types with ``to_model_async``, sibling fields are awaited concurrently.
+
+        At most ``concurrency`` (by default :attr:`async_concurrency`) calls are awaited at once.
+        Models without asynchronous types are converted inline, as with :meth:`to_model`.
+        Lazy conversion and generated converters are not used for dataclasses with asynchronous fields.
+        """
+        convert = self._async_plans.get(
+            cls, metadata, lambda: self._compile_async(self._schema.generate(cls, metadata))
+        )
+        if convert is None:
+            return self.to_model(data, cls, metadata)
+
+        import asyncio
+
+        limit = asyncio.Semaphore(concurrency or self.async_concurrency)
+        context = LoadContext()
+        context_token = load_context.set(context)
+        budget_token = error_budget.set(ErrorBudget(self._max_errors)) if self._max_errors else None
+        try:
+            if self._interpolation:
+                from glorpen.config.model.interpolation import interpolate
+                data = interpolate(data)
+            value = await convert(data, limit)
+            context.finish()
+            return value
+        except ValueError as e:
+            raise ConfigValueError(e) from None
+        finally:
+            if budget_token is not None:
+                error_budget.reset(budget_token)
+            load_context.reset(context_token)
+
+    def iter_models(self, items: typing.Iterable, cls, metadata=None, with_errors=False) -> typing.Iterator:
+        """Lazily converts each item with a single model.
+
+        By default first invalid item raises :class:`ConfigValueError`. With ``with_errors`` it yields
+        ``(index, value)`` pairs instead, where value is :class:`ConfigValueError` for invalid items.
+        """
+        convert = self._converter_for(cls, metadata)
+        for index, data in enumerate(items):
+            try:
+                value = convert(data)
+            except ValueError as e:
+                if not with_errors:
+                    raise ConfigValueError(e) from None
+                yield index, ConfigValueError(e)
+            else:
+                yield (index, value) if with_errors else value
+
+    def update(self, old_model, old_data, new_data, cls=None, metadata=None):
+        """Converts new data reusing parts of a model previously converted from old data.
+
+        Values for unchanged raw subtrees are reused by identity, only changed values are converted again
+        and only their ancestors are rebuilt and validated. ``cls`` defaults to type of ``old_model``.
+        """
+        model = self._schema.generate(cls or type(old_model), metadata)
+
+        def convert(_):
+            return self._update(old_model, old_data, new_data, model)
+
         try:
-            return self._as_model(data, model)
+            if self._interpolation:
+                from glorpen.config.model.interpolation import interpolate
+                old_data = interpolate(old_data)
+                new_data = interpolate(new_data)
+            if self._max_errors:
+                convert = functools.partial(self._convert_with_budget, convert)
+            return self._convert_in_context(convert, None)
         except ValueError as e:
             raise ConfigValueError(e) from None
 
+    @classmethod
+    def _get_stored_value(cls, instance, name):
+        try:
+            return vars(instance)[name]
+        except (TypeError, KeyError):
+            return getattr(instance, name)
+
+    def _update(self, old_value, old_data, new_data, model: Field):
+        if is_same_data(old_data, new_data):
+            return old_value
+
+        if not (
+                hasattr(model.args, "items") and dataclasses.is_dataclass(old_value)
+                and isinstance(old_data, dict) and isinstance(new_data, dict)
+        ):
+            if self._plans is None:
+                return self._as_model(new_data, model)
+            return self.compile(model)(new_data)
+
+        kwargs = {}
+        errors = {}
+        convert_fields(new_data, (
+            (
+                field_name,
+                functools.partial(
+                    self._update, self._get_stored_value(old_value, field_name), old_data.get(field_name), model=field
+                )
+            )
+            for field_name, field in model.args.items()
+        ), kwargs, errors)
+        return self._build_instance(type(old_value), frozenset(model.args), new_data, kwargs, errors)
+
+    def compile(self, model: Field) -> Converter:
+        """Builds converter for given model with config types selected once for each node."""
+        convert = self._compile_value(model)
+        bulk = bulk_converter(convert)
+
+        if self._intern_pool is not None:
+            convert, bulk = self._with_interning(convert, bulk)
+
+        def convert_optional(data):
+            if data is None:
+                return self._handle_optional_values(model)
+            return convert(data)
+
+        if bulk is not None and not model.is_optional():
+            def convert_bulk(values):
+                if None in values:
+                    raise ValueError("No value provided")
+                return bulk(values)
+
+            convert_optional.bulk = convert_bulk
+
+        return convert_optional
+
+    def _with_interning(self, convert: Converter, bulk):
+        intern = self._intern_pool.intern
+
+        def convert_interned(data):
+            return intern(convert(data))
+
+        if bulk is None:
+            return convert_interned, None
+        return convert_interned, lambda values: list(map(intern, bulk(values)))
+
+    def _compile_value(self, model: Field) -> Converter:
+        if hasattr(model.args, "items"):
+            return self._compile_named_fields(model)
+        return self._compile_type(model)
+
+    def _compile_field(self, model: Field) -> Converter:
+        if not self._codegen:
+            return self.compile(model)
+
+        # generated code handles missing values by itself
+        convert = self._compile_value(model)
+        if self._intern_pool is not None:
+            convert, _ = self._with_interning(convert, None)
+        return convert
+
+    def _compile_named_fields(self, model: Field) -> Converter:
+        converters = dict((field_name, self._compile_field(field)) for field_name, field in model.args.items())
+        cls = self._instance_class(model.type)
+
+        if self._lazy:
+            from glorpen.config.model import lazy
+            lazy_names = [field_name for field_name, field in model.args.items() if lazy.is_lazy_field(field)]
+            for field_name in lazy_names:
+                converters[field_name] = lazy.lazy_converter(
+                    model.args[field_name], converters[field_name], self.lazy_collection_size
+                )
+            if lazy_names:
+                cls = lazy.lazy_class(cls, lazy_names)
+
+        if self._codegen:
+            from glorpen.config.model import codegen
+            defaults = None
+            if self._compact:
+                defaults = dict(
+                    (field_name, functools.partial(self._get_default, field))
+                    for field_name, field in model.args.items() if field.default_factory
+                )
+            return codegen.named_fields_converter(
+                model, converters, functools.partial(self._build_instance, cls, frozenset(model.args)), defaults
+            )
+
+        fields = tuple(converters.items())
+        known_fields = frozenset(model.args)
+
+        def convert(data):
+            check_mapping(data)
+            kwargs = {}
+            errors = {}
+            convert_fields(data, fields, kwargs, errors)
+            return self._build_instance(cls, known_fields, data, kwargs, errors)
+
+        return convert
+
+    def _compile_async(self, model: Field) -> typing.Optional[AsyncConverter]:
+        """Builds async converter for model with asynchronous types, ``None`` if it can be converted synchronously."""
+        if hasattr(model.args, "items"):
+            return self._compile_async_named_fields(model)
+
+        if model.type is typing.Union:
+            return self._compile_async_union(model)
+
+        reg_type = self._select_type(model)
+        convert_async = getattr(reg_type, "to_model_async", None)
+        if convert_async is None:
+            return None
+
+        async def convert(data, limit: "asyncio.Semaphore"):
+            if data is None:
+                return self._handle_optional_values(model)
+            async with limit:
+                value = await convert_async(data, model)
+            if self._intern_pool is not None:
+                return self._intern_pool.intern(value)
+            return value
+
+        return convert
+
+    def _compile_async_union(self, model: Field) -> typing.Optional[AsyncConverter]:
+        # only optional values are awaited, members of other unions are probed with values synchronously
+        members = [arg for arg in model.args if arg.type is not NoneType]
+        convert_member = self._compile_async(members[0]) if len(members) == 1 else None
+        if convert_member is None:
+            return None
+
+        async def convert(data, limit: "asyncio.Semaphore"):
+            if data is None:
+                return self._handle_optional_values(model)
+            return await convert_member(data, limit)
+
+        return convert
+
+    def _compile_async_named_fields(self, model: Field) -> typing.Optional[AsyncConverter]:
+        async_fields = []
+        sync_fields = []
+        for field_name, field in model.args.items():
+            convert_field = self._compile_async(field)
+            if convert_field is None:
+                sync_fields.append((field_name, self.compile(field)))
+            else:
+                async_fields.append((field_name, convert_field))
+
+        if not async_fields:
+            return None
+
+        cls = self._instance_class(model.type)
+        known_fields = frozenset(model.args)
+
+        async def convert(data, limit: "asyncio.Semaphore"):
+            if data is None:
+                return self._handle_optional_values(model)
+            check_mapping(data)
+
+            kwargs = {}
+            errors = {}
+            convert_fields(data, sync_fields, kwargs, errors)
+
+            if len(async_fields) == 1:
+                field_name, convert_field = async_fields[0]
+                try:
+                    results = [await convert_field(data.get(field_name), limit)]
+                except ValueError as e:
+                    results = [e]
+            else:
+                import asyncio
+
+                results = await asyncio.gather(
+                    *(convert_field(data.get(field_name), limit) for field_name, convert_field in async_fields),
+                    return_exceptions=True
+                )
+
+            for (field_name, _), result in zip(async_fields, results):
+                if isinstance(result, ValueError):
+                    if add_error(errors, field_name, result):
+                        raise CollectionValueError(errors, truncated=True)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    kwargs[field_name] = result
+
+            instance = self._build_instance(cls, known_fields, data, kwargs, errors)
+            if self._intern_pool is not None:
+                return self._intern_pool.intern(instance)
+            return instance
+
+        return convert
+
+    def _select_type(self, model: Field) -> typing.Optional[ConfigType]:
+        """Returns type handling model, ``None`` when it has to be probed with values."""
+        for reg_type in self._types_for(model.type):
+            handles = reg_type.handles(model)
+            if handles is None:
+                return None
+            if handles:
+                return reg_type
+        return None
+
+    def _compile_type(self, model: Field) -> Converter:
+        for reg_type in self._types_for(model.type):
+            handles = reg_type.handles(model)
+            if handles is None:
+                return functools.partial(self._from_type, model=model)
+            if handles:
+                return reg_type.compile(model, self.compile)
+
+        def unsupported(data):
+            raise ValueError(f"Could not convert to {type}")
+
+        return unsupported
+
     @classmethod
     def _get_default_factory(cls, field: dataclasses.Field):
         if field.default is not dataclasses.MISSING:
@@ -111,34 +763,80 @@ class Transformer:
             return None
 
     def _from_named_fields(self, data: typing.Dict, model: Field):
+        check_mapping(data)
         kwargs = {}
         errors = {}
-        known_fields = set()
-        for field_name, field in model.args.items():
-            known_fields.add(field_name)
-            try:
-                kwargs[field_name] = self._as_model(data.get(field_name), field)
-            except ValueError as e:
-                errors[field_name] = e
-
-        for extra_field in set(data.keys()).difference(known_fields):
-            errors[extra_field] = ValueError("Extra field")
+        convert_fields(data, (
+            (field_name, functools.partial(self._as_model, model=field)) for field_name, field in model.args.items()
+        ), kwargs, errors)
+        return self._build_instance(self._instance_class(model.type), frozenset(model.args), data, kwargs, errors)
+
+    def _build_instance(self, cls, known_fields: typing.AbstractSet[str], data, kwargs: dict, errors: dict):
+        """Reports extra fields and errors collected for named fields, then creates and validates instance."""
+        if not known_fields.issuperset(data):
+            for key in data:
+                if key not in known_fields and add_error(errors, key, ValueError("Extra field")):
+                    raise CollectionValueError(errors, truncated=True)
+
+        # values deferred by types, eg. secrets, have to be ready before validators read them
+        context = load_context.get()
+        if context is not None:
+            context.flush()
+            for key, error in context.pop_failures(kwargs).items():
+                if add_error(errors, key, error):
+                    raise CollectionValueError(errors, truncated=True)
 
         if errors:
             raise CollectionValueError(errors)
 
-        instance = model.type(**kwargs)
+        instance = cls(**kwargs)
         if self._validator:
             self._validator.validate(instance)
         return instance
 
     def _from_type(self, data: typing.Any, model: Field):
-        for reg_type in self._registered_types:
+        for reg_type in self._types_for(model.type):
             value = reg_type.to_model(data=data, model=model)
             if value is not None:
                 return value
 
         raise ValueError(f"Could not convert to {type}")
 
+    def _types_for(self, tp) -> typing.Tuple[ConfigType, ...]:
+        """Returns registered types that could handle given :attr:`Field.type`, in priority order."""
+        try:
+            return self._dispatch[tp]
+        except KeyError:
+            types = self._dispatch[tp] = self._find_types(tp)
+            return types
+        except TypeError:
+            return self._find_types(tp)
+
+    def _find_types(self, tp):
+        types = []
+        for index, reg_type in enumerate(self._registered_types):
+            if isinstance(reg_type, LazyType):
+                if not reg_type.matches(tp):
+                    continue
+                reg_type = self._registered_types[index] = reg_type.load()(self._as_model)
+            if reg_type.handles_type(tp) is not False:
+                types.append(reg_type)
+        return tuple(types)
+
+    @property
+    def intern_pool(self) -> typing.Optional["InternPool"]:
+        return self._intern_pool
+
     def register_type(self, type_cls: typing.Type[ConfigType]):
-        self._registered_types.insert(0, type_cls(self._as_model))
+        self._add_type(type_cls(self._as_model))
+
+    def register_lazy_type(self, path: str, handled: typing.Iterable[typing.Any]):
+        """Registers config type by import path, see :class:`LazyType`."""
+        self._add_type(LazyType(path, tuple(handled)))
+
+    def _add_type(self, reg_type: typing.Union[ConfigType, LazyType]):
+        self._registered_types.insert(0, reg_type)
+        self._dispatch.clear()
+        if self._plans is not None:
+            self._plans.clear()
+        self._async_plans.clear()
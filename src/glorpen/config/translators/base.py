@@ -1,4 +1,7 @@
+import collections
 import contextlib
+import os
+import threading
 
 class BaseHelp(object):
     has_description = False
@@ -114,10 +117,70 @@ class Renderer(object):
         self.visit(help)
         return self.finish()
 
+def list_indent(items, prefix):
+    for item in items:
+        yield f"{prefix}{item}"
+
 class Reader(object):
     def read(self):
         raise NotImplementedError()
 
+class FileReader(Reader):
+    """Reads document from file path or already opened binary stream.
+
+    Parsed files are cached by path, modification time and size so unchanged files are not parsed again.
+    Cached documents are shared between readers and should not be modified.
+    At most :attr:`cache_size` documents are kept, least recently read ones are dropped first.
+    """
+
+    #: Number of cached documents, ``0`` disables caching.
+    cache_size = 16
+
+    _documents = collections.OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, source):
+        super().__init__()
+
+        self.source = source
+
+    def read(self):
+        if hasattr(self.source, "read"):
+            return self.parse(self.source)
+
+        path = os.path.abspath(self.source)
+        stat = os.stat(path)
+        key = (self.__class__, path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._documents.get(key)
+            if cached is not None and cached[0] == version:
+                self._documents.move_to_end(key)
+                return cached[1]
+
+        with open(path, "rb") as f:
+            data = self.parse_file(f)
+
+        with self._lock:
+            self._documents[key] = (version, data)
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.cache_size:
+                self._documents.popitem(last=False)
+        return data
+
+    def parse_file(self, f):
+        return self.parse(f.read())
+
+    def parse(self, stream_or_bytes):
+        raise NotImplementedError()
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._lock:
+            for key in [k for k in cls._documents.keys() if issubclass(k[0], cls)]:
+                cls._documents.pop(key, None)
+
 class Translator(object):
     def __init__(self, config):
         super().__init__()
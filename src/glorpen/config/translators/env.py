@@ -0,0 +1,63 @@
+import os
+import typing
+
+from glorpen.config.model.schema import Field
+from glorpen.config.translators.base import Reader
+
+
+class EnvironmentReader(Reader):
+    """Reads values from environment variables named after paths in schema, eg. ``APP__DATABASE__POOL_SIZE``.
+
+    Names are matched case insensitively against named fields of given model, including fields of optional
+    sections and other union members, parts not found in schema are kept lowercased so conversion reports them. Values are left as strings for config types to convert.
+    """
+
+    def __init__(self, model: Field, prefix: str, separator: str = "__",
+                 environ: typing.Optional[typing.Mapping[str, str]] = None):
+        super().__init__()
+
+        self.model = model
+        self.prefix = prefix + separator
+        self.separator = separator
+        self.environ = environ
+
+    @classmethod
+    def _field_names(cls, model: typing.Optional[Field]):
+        if model is None:
+            return {}
+        if hasattr(model.args, "items"):
+            return dict((name.lower(), (name, field)) for name, field in model.args.items())
+
+        names = {}
+        if model.type is typing.Union:
+            # earlier members take precedence
+            for member in model.args:
+                for key, value in cls._field_names(member).items():
+                    names.setdefault(key, value)
+        return names
+
+    def _map_path(self, parts: typing.Sequence[str]):
+        model = self.model
+        for part in parts:
+            name, model = self._field_names(model).get(part.lower(), (part.lower(), None))
+            yield name
+
+    def read(self):
+        environ = os.environ if self.environ is None else self.environ
+        data = {}
+
+        for key in environ:
+            if not key.startswith(self.prefix):
+                continue
+
+            *parents, name = self._map_path(key[len(self.prefix):].split(self.separator))
+            node = data
+            for parent in parents:
+                node = node.setdefault(parent, {})
+                if not isinstance(node, dict):
+                    raise ValueError(f"Environment variable {key} conflicts with value of {parent}")
+            if isinstance(node.get(name), dict):
+                raise ValueError(f"Environment variable {key} conflicts with nested values")
+            node[name] = environ[key]
+
+        return data
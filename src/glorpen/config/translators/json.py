@@ -0,0 +1,33 @@
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from glorpen.config.translators.base import FileReader
+
+
+class JsonReader(FileReader):
+    """Reads JSON documents, uses :mod:`orjson` when installed.
+
+    With orjson files are memory mapped and parsed directly from mapped bytes,
+    otherwise they are read as bytes in one call, both without decoding to text first.
+    """
+
+    def parse_file(self, f):
+        if orjson is None or os.fstat(f.fileno()).st_size == 0:
+            return self.parse(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+    def parse(self, stream_or_bytes):
+        if hasattr(stream_or_bytes, "read"):
+            stream_or_bytes = stream_or_bytes.read()
+        if orjson is None:
+            return json.loads(stream_or_bytes)
+        return orjson.loads(stream_or_bytes)
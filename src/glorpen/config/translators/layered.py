@@ -0,0 +1,119 @@
+import concurrent.futures
+import importlib
+import os
+import typing
+
+from glorpen.config.model.transformer import iter_errors
+from glorpen.config.translators.base import Reader
+
+_MISSING = object()
+
+
+class Provenance:
+    """Maps paths in merged document to sources, only roots of subtrees taken from a single source are stored."""
+
+    __slots__ = ("source", "children")
+
+    def __init__(self, source=None):
+        super(Provenance, self).__init__()
+        self.source = source
+        self.children = {}
+
+    def set(self, path: typing.Tuple, source: str):
+        node = self
+        for key in path:
+            node = node.children.setdefault(key, Provenance())
+        node.source = source
+        node.children = {}
+
+    def get(self, path: typing.Tuple) -> typing.Optional[str]:
+        node = self
+        source = node.source
+        for key in path:
+            node = node.children.get(key)
+            if node is None:
+                break
+            source = node.source or source
+        return source
+
+
+class LayeredReader(Reader):
+    """Reads and deep merges documents from many sources, later sources take precedence.
+
+    Sources can be file paths, directories with fragments (eg. ``conf.d``, read in file name order)
+    or :class:`Reader` instances. Files are parsed concurrently in a thread pool.
+    Empty documents, eg. YAML files with comments only, are skipped.
+    """
+
+    readers = {
+        ".yaml": "glorpen.config.translators.yaml:YamlReader",
+        ".yml": "glorpen.config.translators.yaml:YamlReader",
+        ".toml": "glorpen.config.translators.toml:TomlReader",
+        ".json": "glorpen.config.translators.json:JsonReader",
+    }
+
+    def __init__(self, *sources, max_workers: typing.Optional[int] = None):
+        super().__init__()
+
+        self.sources = sources
+        self.max_workers = max_workers
+        self.provenance = Provenance()
+
+    def _get_reader_class(self, path: str):
+        name = self.readers[os.path.splitext(path)[1].lower()]
+        module, cls = name.split(":")
+        return getattr(importlib.import_module(module), cls)
+
+    def _iter_readers(self):
+        for source in self.sources:
+            if isinstance(source, Reader):
+                yield str(getattr(source, "source", source.__class__.__name__)), source
+            elif os.path.isdir(source):
+                for name in sorted(os.listdir(source)):
+                    path = os.path.join(source, name)
+                    if os.path.splitext(name)[1].lower() in self.readers and os.path.isfile(path):
+                        yield path, self._get_reader_class(path)(path)
+            else:
+                path = os.fspath(source)
+                yield path, self._get_reader_class(path)(path)
+
+    def read(self):
+        readers = list(self._iter_readers())
+
+        if len(readers) > 1:
+            with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+                documents = list(executor.map(lambda r: r[1].read(), readers))
+        else:
+            documents = [r.read() for _, r in readers]
+
+        self.provenance = Provenance()
+        owned = set()
+        result = _MISSING
+        for (name, _), document in zip(readers, documents):
+            if document is not None:
+                result = self._merge(result, document, (), name, owned)
+
+        return None if result is _MISSING else result
+
+    def _merge(self, target, value, path: typing.Tuple, source: str, owned: typing.Set[int]):
+        if not (isinstance(target, dict) and isinstance(value, dict)):
+            # parsed documents can be shared by reader caches so subtrees are referenced, not modified
+            self.provenance.set(path, source)
+            return value
+
+        if id(target) not in owned:
+            target = dict(target)
+            owned.add(id(target))
+
+        for key, item in value.items():
+            target[key] = self._merge(target.get(key, _MISSING), item, path + (key,), source, owned)
+
+        return target
+
+    def source_of(self, path: typing.Sequence) -> typing.Optional[str]:
+        """Returns source which provided value at given path of last read document."""
+        return self.provenance.get(tuple(path))
+
+    def explain(self, error: ValueError) -> typing.List[typing.Tuple[typing.Tuple, typing.Optional[str], ValueError]]:
+        """Lists paths, responsible sources and errors found in conversion error."""
+        return [(path, self.source_of(path), e) for path, e in iter_errors(error)]
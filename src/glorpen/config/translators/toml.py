@@ -0,0 +1,79 @@
+import datetime
+import json
+import textwrap
+import typing
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+from glorpen.config.model.schema import Field
+from glorpen.config.translators.base import FileReader, list_indent
+
+
+class TomlReader(FileReader):
+    """Reads TOML documents with :mod:`tomllib` or ``tomli`` on older Python versions."""
+
+    def parse_file(self, f):
+        return tomllib.load(f)
+
+    def parse(self, stream_or_bytes):
+        if hasattr(stream_or_bytes, "read"):
+            return tomllib.load(stream_or_bytes)
+        return tomllib.loads(stream_or_bytes.decode())
+
+
+def format_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return "[" + ", ".join(format_value(v) for v in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{json.dumps(str(k))} = {format_value(v)}" for k, v in value.items()) + "}"
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+class TomlRenderer:
+    """Renders example TOML config, optional values are commented out."""
+
+    def render(self, model: Field):
+        return "\n".join(list(self._render_table(model, ()))) + "\n"
+
+    @classmethod
+    def _render_doc(cls, doc):
+        if doc:
+            yield from list_indent(textwrap.wrap(doc, width=60), "# ")
+
+    def _render_table(self, model: Field, path: typing.Tuple[str, ...]):
+        tables = []
+        for name, field in model.args.items():
+            if isinstance(field.args, dict):
+                tables.append((name, field))
+                continue
+
+            yield from self._render_doc(field.doc)
+            yield self._render_value(name, field)
+
+        for name, field in tables:
+            table_path = path + (name,)
+            prefix = "# " if field.default_factory else ""
+            yield ""
+            yield from self._render_doc(field.doc)
+            yield prefix + "[" + ".".join(table_path) + "]"
+            for line in self._render_table(field, table_path):
+                yield prefix + line if line else line
+
+    @classmethod
+    def _render_value(cls, name: str, model: Field):
+        # TOML has no null value, None defaults are rendered as optional ones
+        default = model.default_factory() if model.default_factory else None
+        if default is not None:
+            return f"# {name} = {format_value(default)}"
+        if model.default_factory or model.is_nullable():
+            return f"# {name} = # optional"
+        return f"{name} = # required {model.type.__name__}"
@@ -4,11 +4,19 @@ import typing
 import yaml
 
 from glorpen.config.model.schema import Field
+from glorpen.config.translators.base import FileReader, list_indent
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-def list_indent(items: typing.Iterable[str], prefix):
-    for item in items:
-        yield f"{prefix}{item}"
+
+class YamlReader(FileReader):
+    """Reads YAML documents, uses libyaml loader when available."""
+
+    def parse(self, stream_or_bytes):
+        return yaml.load(stream_or_bytes, Loader=SafeLoader)
 
 
 class YamlRenderer:
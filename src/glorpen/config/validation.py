@@ -1,6 +1,9 @@
 import abc
 import contextlib
 import typing
+import weakref
+
+from glorpen.config.model.compact import origin_class
 
 
 class ValidatableData(abc.ABC):
@@ -9,11 +12,19 @@ class ValidatableData(abc.ABC):
         pass
 
 
-ValidatorType = typing.Callable[[], None]
+ValidatorType = typing.Callable[[typing.Any], None]
 
 
 class Validator:
+    """Runs model validation.
+
+    Validators registered for a class are run for its instances and instances of its subclasses, in MRO order
+    from most generic class. Validator chains are resolved once for each concrete class,
+    classes are referenced weakly so they can be collected.
+    """
+
     _validators: typing.Dict[typing.Type, typing.List[ValidatorType]]
+    _chains: typing.MutableMapping[typing.Type, typing.Tuple[ValidatorType, ...]]
 
     def __init__(self, use_method=True, use_class=True):
         super(Validator, self).__init__()
@@ -21,6 +32,7 @@ class Validator:
         self._use_method = use_method
         self._use_class = use_class
         self._validators = {}
+        self._chains = weakref.WeakKeyDictionary()
 
     @contextlib.contextmanager
     def _run_validation(self):
@@ -30,17 +42,37 @@ class Validator:
             msg = str(e) if e.args else "Validation failed"
             raise ValueError(msg)
 
+    def _resolve_chain(self, cls: typing.Type) -> typing.Tuple[ValidatorType, ...]:
+        # compact variants of models are validated as their original classes
+        cls = origin_class(cls)
+        chain = []
+        for base in reversed(cls.__mro__):
+            chain.extend(self._validators.get(base, ()))
+        # abstract base classes can be registered without being in MRO
+        for registered, validators in self._validators.items():
+            if registered not in cls.__mro__ and issubclass(cls, registered):
+                chain.extend(validators)
+        return tuple(chain)
+
+    def _get_chain(self, cls: typing.Type) -> typing.Tuple[ValidatorType, ...]:
+        try:
+            return self._chains[cls]
+        except KeyError:
+            chain = self._chains[cls] = self._resolve_chain(cls)
+            return chain
+
     def validate(self, model):
         if (self._use_class and isinstance(model, ValidatableData)) or (
                 self._use_method and hasattr(model, "validate")):
             with self._run_validation():
                 model.validate()
 
-        for (cls, validators) in self._validators:
-            if isinstance(model, cls):
-                with self._run_validation():
-                    for v in validators:
-                        v(model)
+        chain = self._get_chain(type(model))
+        if chain:
+            with self._run_validation():
+                for v in chain:
+                    v(model)
 
     def register_validator(self, cls: typing.Type, f: ValidatorType):
         self._validators.setdefault(cls, []).append(f)
+        self._chains.clear()
@@ -0,0 +1,99 @@
+import array
+import dataclasses
+import typing
+
+import pytest
+
+from glorpen.config.fields.array import Array, ArrayType
+from glorpen.config.fields.simple import CollectionTypes, SimpleTypes
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import Transformer
+
+
+class PlainArrayType(ArrayType):
+    use_numpy = False
+
+
+@dataclasses.dataclass
+class Histogram:
+    weights: typing.Annotated[typing.List[float], Array("d", min=0)]
+    buckets: typing.List[int] = dataclasses.field(default_factory=list, metadata={"array": "q", "max": 10})
+    names: typing.List[int] = dataclasses.field(default_factory=list)
+
+
+def create_config(array_type=PlainArrayType, compiled=True):
+    return Transformer(schema=Schema(), types=[SimpleTypes, CollectionTypes, array_type], compiled=compiled)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_array(compiled):
+    c = create_config(compiled=compiled)
+
+    h = c.to_model({"weights": [1, "2.5"], "buckets": [1, 2], "names": ["1"]}, Histogram)
+
+    assert h.weights == array.array("d", [1.0, 2.5])
+    assert h.buckets == array.array("q", [1, 2])
+    assert h.names == [1]
+
+
+def test_array_type():
+    c = create_config()
+    assert c.to_model([1, 2], array.array, metadata={"array": "b"}) == array.array("b", [1, 2])
+
+
+def test_item_errors():
+    c = create_config()
+
+    with pytest.raises(ValueError) as e:
+        c.to_model({"weights": [1, "x", None]}, Histogram)
+    assert set(e.value.error.items["weights"].items.keys()) == {1, 2}
+
+    with pytest.raises(ValueError, match="Expected sequence"):
+        c.to_model({"weights": "123"}, Histogram)
+
+
+def test_range():
+    c = create_config()
+
+    with pytest.raises(ValueError) as e:
+        c.to_model({"weights": [1, -1], "buckets": [11, 3, 12]}, Histogram)
+
+    items = e.value.error.items
+    assert str(items["weights"].items[1]) == "Value is lower than 0"
+    assert set(items["buckets"].items.keys()) == {0, 2}
+
+
+def test_nan():
+    c = create_config()
+
+    with pytest.raises(ValueError) as e:
+        c.to_model({"weights": [1, float("nan"), "nan"]}, Histogram)
+    assert set(e.value.error.items["weights"].items.keys()) == {1, 2}
+    assert str(e.value.error.items["weights"].items[1]) == "Value is not a number"
+
+    h = c.to_model([1, float("nan")], typing.List[float], metadata={"array": "d"})
+    assert h[1] != h[1]
+
+
+def test_unknown_typecode():
+    with pytest.raises(TypeError, match="type code"):
+        create_config().to_model([1], typing.List[int], metadata={"array": "x"})
+
+
+def test_numpy():
+    numpy = pytest.importorskip("numpy")
+    c = create_config(ArrayType)
+
+    h = c.to_model({"weights": [1, "2.5"]}, Histogram)
+    assert isinstance(h.weights, numpy.ndarray)
+    assert h.weights.tolist() == [1.0, 2.5]
+
+    with pytest.raises(ValueError, match="lower than 0"):
+        c.to_model({"weights": [1, -1]}, Histogram)
+
+    with pytest.raises(ValueError) as e:
+        c.to_model({"weights": [1, None, "x"]}, Histogram)
+    assert set(e.value.error.items["weights"].items.keys()) == {1, 2}
+
+    with pytest.raises(ValueError, match="not a number"):
+        c.to_model({"weights": [1, float("nan")]}, Histogram)
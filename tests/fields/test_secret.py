@@ -0,0 +1,140 @@
+import dataclasses
+import typing
+
+import pytest
+
+from glorpen.config.fields.secret import Backend, EnvBackend, FileBackend, Secret, SecretType
+from glorpen.config.fields.simple import CollectionTypes, UnionType
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import Transformer
+from glorpen.config.validation import Validator
+
+
+class CountingBackend(Backend):
+    def __init__(self):
+        super(CountingBackend, self).__init__()
+        self.fetched = []
+
+    def fetch(self, location: str) -> str:
+        self.fetched.append(location)
+        return location.upper()
+
+
+@dataclasses.dataclass
+class Database:
+    password: Secret
+    token: Secret
+    other: typing.Optional[Secret] = None
+
+
+def create_config(backend=None, ttl=60, **kwargs):
+    class TestSecretType(SecretType):
+        backends = {"file": FileBackend(), "env": EnvBackend({"DB_PASS": "env-pass"}), "test": backend}
+
+    TestSecretType.ttl = ttl
+    return Transformer(schema=Schema(), types=[UnionType, CollectionTypes, TestSecretType], **kwargs)
+
+
+def test_resolve(tmp_path):
+    (tmp_path / "password").write_text("file-pass\n")
+    c = create_config()
+
+    m = c.to_model({"password": f"file://{tmp_path / 'password'}", "token": "env:DB_PASS"}, Database)
+
+    assert m.password.get() == "file-pass"
+    assert m.token.get() == "env-pass"
+    assert "file-pass" not in repr(m)
+
+
+def test_errors(tmp_path):
+    c = create_config()
+
+    with pytest.raises(ValueError) as e:
+        c.to_model({"password": f"file://{tmp_path / 'missing'}", "token": "env:MISSING"}, Database)
+    assert set(e.value.error.items.keys()) == {"password", "token"}
+    assert "Environment variable MISSING is not set" in str(e.value.error.items["token"])
+
+    with pytest.raises(ValueError, match="Unknown reference scheme"):
+        c.to_model({"password": "plain", "token": "env:DB_PASS"}, Database)
+
+
+def test_batch_and_cache():
+    backend = CountingBackend()
+    c = create_config(backend)
+
+    m = c.to_model({"password": "test:a", "token": "test:a", "other": "test:b"}, Database)
+    assert (m.password.get(), m.other.get()) == ("A", "B")
+    assert sorted(backend.fetched) == ["a", "b"]
+
+    c.to_model({"password": "test:a", "token": "test:c"}, Database)
+    assert sorted(backend.fetched) == ["a", "b", "c"]
+
+
+def test_expired():
+    backend = CountingBackend()
+    c = create_config(backend, ttl=-1)
+
+    c.to_model({"password": "test:a", "token": "test:a"}, Database)
+    c.to_model({"password": "test:a", "token": "test:a"}, Database)
+    assert backend.fetched == ["a", "a"]
+
+
+def test_unresolved():
+    with pytest.raises(LookupError):
+        Secret("env:X").get()
+
+
+@dataclasses.dataclass
+class CheckedDatabase:
+    password: Secret
+    token: Secret
+
+    def validate(self):
+        assert self.password.get() != self.token.get(), "Password and token should differ"
+
+
+@pytest.mark.parametrize("options", [{"compiled": False}, {"compiled": True}, {"codegen": True}])
+def test_validated(options):
+    backend = CountingBackend()
+    c = create_config(backend, validator=Validator(), **options)
+
+    m = c.to_model({"password": "test:a", "token": "test:b"}, CheckedDatabase)
+    assert m.password.get() == "A"
+    assert sorted(backend.fetched) == ["a", "b"]
+
+    with pytest.raises(ValueError, match="should differ"):
+        c.to_model({"password": "test:a", "token": "test:a"}, CheckedDatabase)
+
+
+@dataclasses.dataclass
+class Checked:
+    value: int = 0
+
+    def validate(self):
+        assert self.value >= 0
+
+
+@dataclasses.dataclass
+class Root:
+    db: Database
+    other: Checked
+    tokens: typing.List[Secret] = dataclasses.field(default_factory=list)
+
+
+@pytest.mark.parametrize("options", [{"compiled": False}, {"compiled": True}, {"codegen": True}])
+def test_errors_path(options):
+    c = create_config(validator=Validator(), **options)
+
+    data = {"db": {"password": "env:MISSING", "token": "env:DB_PASS"}, "other": {}, "tokens": ["env:DB_PASS", "env:X"]}
+    with pytest.raises(ValueError) as e:
+        c.to_model(data, Root)
+
+    errors = e.value.error.items
+    assert set(errors.keys()) == {"db", "tokens"}
+    assert set(errors["db"].items.keys()) == {"password"}
+    assert set(errors["tokens"].items.keys()) == {1}
+
+
+def test_top_level_errors():
+    with pytest.raises(ValueError, match="MISSING is not set"):
+        create_config().to_model("env:MISSING", Secret)
@@ -1,16 +1,17 @@
+import dataclasses
 import pathlib
 import typing
 
 import pytest
 
-from glorpen.config.fields.simple import BooleanType, CollectionTypes, LiteralType, PathType, SimpleTypes
+from glorpen.config.fields.simple import BooleanType, CollectionTypes, LiteralType, PathType, SimpleTypes, UnionType
 from glorpen.config.model.schema import Schema
 from glorpen.config.model.transformer import Transformer
 from glorpen.config.validation import Validator
 
 
-def create_config(types=None):
-    return Transformer(schema=Schema(), validator=Validator(), types=types)
+def create_config(types=None, compiled=True):
+    return Transformer(schema=Schema(), validator=Validator(), types=types, compiled=compiled)
 
 
 class Dummy:
@@ -47,7 +48,7 @@ class TestSimpleTypes:
 
     def test_list(self):
         c = self.create_config()
-        assert c.to_model("abc", typing.List[str]) == ["a", "b", "c"]
+        assert c.to_model("abc", list) == ["a", "b", "c"]
 
 
 class TestBooleanType:
@@ -87,6 +88,32 @@ class TestPathType:
         assert c.to_model("/non/../absolute", pathlib.Path, metadata={"absolute": True}) == pathlib.Path("/absolute")
         assert c.to_model("~/asd", pathlib.Path, metadata={"expand": True}).is_absolute()
 
+    def test_resolve_cache(self, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "file").touch()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        (tmp_path / "real" / "file-link").symlink_to(tmp_path / "real" / "file")
+
+        c = create_config([PathType, CollectionTypes])
+        paths = [tmp_path / "link" / "file", tmp_path / "link" / "file-link", tmp_path / "link" / "other"]
+        expected = tuple(p.resolve() for p in paths)
+
+        assert c.to_model(paths, typing.Tuple[pathlib.Path, ...], metadata={"absolute": True}) == expected
+
+    def test_deferred_checks(self, tmp_path):
+        class DeferredPathType(PathType):
+            deferred_checks = True
+
+        (tmp_path / "file").touch()
+        c = create_config([DeferredPathType, CollectionTypes])
+        paths = [tmp_path / "missing-1", tmp_path / "file", tmp_path / "missing-2"]
+
+        with pytest.raises(ValueError) as e:
+            c.to_model(paths, typing.Tuple[pathlib.Path, ...], metadata={"existing": True})
+
+        assert set(e.value.error.items.keys()) == {str(paths[0]), str(paths[2])}
+        assert c.to_model(paths[1:2], typing.Tuple[pathlib.Path, ...], metadata={"existing": True}) == (paths[1],)
+
 
 class TestCollectionType:
     @classmethod
@@ -103,3 +130,123 @@ class TestCollectionType:
             assert c.to_model([1], typing.Tuple[int, int])
         with pytest.raises(ValueError, match="Extra value"):
             assert c.to_model([1, 2], typing.Tuple[int])
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_generic(self, compiled):
+        c = create_config([UnionType, CollectionTypes, SimpleTypes], compiled=compiled)
+
+        assert c.to_model("abc", typing.List[str]) == ["a", "b", "c"]
+        assert c.to_model(["1", 2], list[int]) == [1, 2]
+        assert c.to_model([1, "1", 2], set[int]) == {1, 2}
+        assert c.to_model([1, "2"], frozenset[int]) == frozenset([1, 2])
+        assert c.to_model(["1", 2, 3.0], tuple[int, ...]) == (1, 2, 3)
+        assert c.to_model({"a": "1.5", 2: 1}, dict[str, float]) == {"a": 1.5, "2": 1.0}
+        assert c.to_model([1, None], list[typing.Optional[int]]) == [1, None]
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_generic_errors(self, compiled):
+        c = create_config([CollectionTypes, SimpleTypes], compiled=compiled)
+
+        with pytest.raises(ValueError) as e:
+            c.to_model([1, "x", None], list[int])
+        assert set(e.value.error.items.keys()) == {1, 2}
+
+        with pytest.raises(ValueError, match="a: Invalid key"):
+            c.to_model({"a": 1}, dict[int, int])
+        with pytest.raises(ValueError, match="b: invalid literal"):
+            c.to_model({"a": 1, "b": "x"}, dict[str, int])
+        with pytest.raises(ValueError, match="Expected mapping"):
+            c.to_model([1], dict[str, int])
+        for tp in (typing.List[int], tuple[int, ...], typing.Tuple[int, int], set[int]):
+            with pytest.raises(ValueError, match="Expected sequence, got int"):
+                c.to_model(5, tp)
+
+    def test_bulk(self):
+        c = self.create_config()
+
+        assert c.compile(c._schema.generate(int)).bulk(["1", 2]) == [1, 2]
+        assert not hasattr(c.compile(c._schema.generate(typing.Optional[int])), "bulk")
+
+
+@dataclasses.dataclass
+class FilePlugin:
+    kind: typing.Literal["file"]
+    path: str
+
+
+@dataclasses.dataclass
+class HttpPlugin:
+    kind: typing.Literal["http", "https"]
+    url: str
+
+
+@dataclasses.dataclass
+class Plugins:
+    plugin: typing.Union[FilePlugin, HttpPlugin]
+    declared: typing.Optional[typing.Union[FilePlugin, HttpPlugin]] = dataclasses.field(
+        default=None, metadata={"discriminator": "kind"}
+    )
+
+
+@dataclasses.dataclass
+class DefaultFilePlugin:
+    path: str
+    kind: typing.Literal["file"] = "file"
+
+
+@dataclasses.dataclass
+class DefaultHttpPlugin:
+    url: str
+    kind: typing.Literal["http"] = "http"
+
+
+DefaultPlugin = typing.Union[DefaultFilePlugin, DefaultHttpPlugin]
+
+
+class TestUnionType:
+    @classmethod
+    def create_config(cls, compiled=True):
+        return create_config([UnionType, SimpleTypes, LiteralType], compiled=compiled)
+
+    def test_first_matching(self):
+        c = self.create_config()
+
+        assert c.to_model("1", typing.Union[int, str]) == 1
+        assert c.to_model("a", typing.Union[int, str]) == "a"
+
+    def test_discriminator_detection(self):
+        p = Schema().generate(Plugins)
+
+        assert p.args["plugin"].discriminator.name == "kind"
+        assert p.args["plugin"].discriminator.branches == {"file": 0, "http": 1, "https": 1}
+        assert p.args["declared"].discriminator.branches == {"file": 0, "http": 1, "https": 1}
+        assert Schema().generate(typing.Union[int, str]).discriminator is None
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_discriminator(self, compiled):
+        c = self.create_config(compiled)
+
+        m = c.to_model({"plugin": {"kind": "https", "url": "http://"}, "declared": {"kind": "file", "path": "/"}}, Plugins)
+        assert m == Plugins(plugin=HttpPlugin(kind="https", url="http://"), declared=FilePlugin(kind="file", path="/"))
+
+        with pytest.raises(ValueError, match=r"plugin: kind: Not one of: 'file', 'http', 'https'$"):
+            c.to_model({"plugin": {"kind": "ftp", "url": "ftp://"}}, Plugins)
+        with pytest.raises(ValueError, match=r"plugin: path: No value provided$"):
+            c.to_model({"plugin": {"kind": "file"}}, Plugins)
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_tags_with_defaults(self, compiled):
+        c = self.create_config(compiled)
+
+        assert Schema().generate(DefaultPlugin).discriminator is None
+        assert c.to_model({"path": "/x"}, DefaultPlugin) == DefaultFilePlugin(path="/x")
+        assert c.to_model({"url": "http://"}, DefaultPlugin) == DefaultHttpPlugin(url="http://")
+
+        declared = {"discriminator": "kind"}
+        assert Schema().generate(DefaultPlugin, declared).discriminator.name == "kind"
+        assert c.to_model({"url": "http://"}, DefaultPlugin, declared) == DefaultHttpPlugin(url="http://")
+        assert c.to_model({"kind": "http", "url": "/"}, DefaultPlugin, declared) == DefaultHttpPlugin(url="/")
+
+    def test_invalid_discriminator(self):
+        with pytest.raises(TypeError, match="'path' is not a discriminator"):
+            Schema().generate(typing.Union[FilePlugin, HttpPlugin], {"discriminator": "path"})
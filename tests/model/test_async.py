@@ -0,0 +1,126 @@
+import asyncio
+import dataclasses
+import typing
+
+import pytest
+
+from glorpen.config.fields.simple import SimpleTypes, UnionType
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import ConfigType, ConfigValueError, Transformer
+from glorpen.config.validation import Validator
+
+
+class Remote(str):
+    pass
+
+
+class RemoteType(ConfigType):
+    handled_bases = (Remote,)
+
+    def __init__(self, converter):
+        super(RemoteType, self).__init__(converter)
+        self.running = 0
+        self.max_running = 0
+
+    def to_model(self, data: typing.Any, model):
+        return Remote(f"sync:{data}")
+
+    async def to_model_async(self, data: typing.Any, model):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.running -= 1
+        if data == "invalid":
+            raise ValueError("Invalid remote")
+        return Remote(f"async:{data}")
+
+
+@dataclasses.dataclass
+class Section:
+    first: Remote
+    second: Remote
+    count: int = 0
+
+
+@dataclasses.dataclass
+class Root:
+    a: Section
+    b: Section
+    name: typing.Optional[str] = None
+    optional: typing.Optional[Remote] = None
+    extra: typing.Optional[Section] = None
+
+    def validate(self):
+        assert self.name != "invalid", "Invalid name"
+
+
+@dataclasses.dataclass
+class Plain:
+    count: int
+
+
+def create_config():
+    return Transformer(schema=Schema(), validator=Validator(), types=[UnionType, SimpleTypes, RemoteType])
+
+
+def get_remote_type(c: Transformer):
+    return next(t for t in c._registered_types if isinstance(t, RemoteType))
+
+
+def test_async():
+    c = create_config()
+    data = {"a": {"first": "1", "second": "2", "count": "3"}, "b": {"first": "3", "second": "4"}}
+
+    m = asyncio.run(c.to_model_async(data, Root))
+
+    assert m.a == Section(Remote("async:1"), Remote("async:2"), 3)
+    assert m.b == Section(Remote("async:3"), Remote("async:4"))
+    assert get_remote_type(c).max_running == 4
+    assert c.to_model(data, Root).a.first == "sync:1"
+
+
+def test_optional():
+    c = create_config()
+    data = {
+        "a": {"first": "1", "second": "2"}, "b": {"first": "3", "second": "4"},
+        "optional": "5", "extra": {"first": "6", "second": "7"},
+    }
+
+    m = asyncio.run(c.to_model_async(data, Root))
+
+    assert m.optional == "async:5"
+    assert m.extra == Section(Remote("async:6"), Remote("async:7"))
+
+    data.pop("extra")
+    assert asyncio.run(c.to_model_async(data, Root)).extra is None
+
+
+def test_concurrency_limit():
+    c = create_config()
+    data = {"a": {"first": "1", "second": "2"}, "b": {"first": "3", "second": "4"}}
+
+    asyncio.run(c.to_model_async(data, Root, concurrency=2))
+
+    assert get_remote_type(c).max_running == 2
+
+
+def test_errors():
+    c = create_config()
+
+    data = {"a": {"first": "invalid", "count": "x"}, "b": {"first": "1", "second": "2"}}
+    with pytest.raises(ConfigValueError) as e:
+        asyncio.run(c.to_model_async(data, Root))
+
+    assert set(e.value.error.items["a"].items.keys()) == {"first", "second", "count"}
+
+    with pytest.raises(ConfigValueError, match="Invalid name"):
+        data = {"a": {"first": "1", "second": "2"}, "b": {"first": "3", "second": "4"}, "name": "invalid"}
+        asyncio.run(c.to_model_async(data, Root))
+
+
+def test_sync_models():
+    c = create_config()
+    assert asyncio.run(c.to_model_async({"count": "1"}, Plain)) == Plain(1)
+    assert asyncio.run(c.to_model_async("x", Remote)) == "async:x"
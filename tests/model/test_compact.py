@@ -0,0 +1,188 @@
+import dataclasses
+import gc
+import pickle
+import sys
+import typing
+import weakref
+
+import pytest
+
+from glorpen.config.fields.simple import CollectionTypes, SimpleTypes
+from glorpen.config.model.compact import compact_class, origin_class
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import Transformer
+from glorpen.config.validation import ValidatableData, Validator
+
+
+@dataclasses.dataclass
+class Retry:
+    count: int = 3
+
+    def doubled(self):
+        return self.count * 2
+
+
+@dataclasses.dataclass
+class Tenant(ValidatableData):
+    name: str
+    retry: Retry = dataclasses.field(default_factory=Retry)
+    tags: typing.Tuple[str, ...] = ()
+
+    def validate(self):
+        assert self.name != "invalid", "Invalid name"
+
+
+def create_config(**kwargs):
+    return Transformer(
+        schema=Schema(), validator=Validator(), types=[SimpleTypes, CollectionTypes], compact=True, **kwargs
+    )
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"compiled": False}, {"codegen": True}])
+def test_compact(kwargs):
+    c = create_config(**kwargs)
+    m = c.to_model({"name": "a", "retry": {"count": "5"}, "tags": ["x"]}, Tenant)
+
+    assert type(m) is compact_class(Tenant)
+    assert type(m.retry) is compact_class(Retry)
+    assert not hasattr(m, "__dict__")
+    assert m.retry.doubled() == 10
+    assert isinstance(m, ValidatableData)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        m.name = "b"
+
+    with pytest.raises(ValueError, match="Invalid name"):
+        c.to_model({"name": "invalid"}, Tenant)
+
+
+def test_registered_validators():
+    v = Validator()
+    v.register_validator(Retry, lambda m: m.count < 10 or 1 / 0)
+    c = Transformer(schema=Schema(), validator=v, types=[SimpleTypes], compact=True)
+
+    with pytest.raises(ZeroDivisionError):
+        c.to_model({"count": 11}, Retry)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"compiled": False}, {"codegen": True}])
+def test_hash(kwargs):
+    c = create_config(**kwargs)
+    m = c.to_model({"name": "a", "tags": ["x"]}, Tenant)
+    other = c.to_model({"name": "a", "tags": ["x"]}, Tenant)
+
+    assert type(m.retry) is compact_class(Retry), "defaults are compacted"
+
+    assert m == other
+    assert {m: 1}[other] == 1
+    assert m._compact_hash == hash(other)
+
+
+@dataclasses.dataclass
+class Service:
+    name: str
+    plugins: typing.List[str] = dataclasses.field(default_factory=list)
+    options: typing.Dict[str, int] = dataclasses.field(default_factory=dict)
+
+
+def test_hash_collections():
+    c = create_config()
+    m = c.to_model({"name": "a", "plugins": ["x", "y"], "options": {"a": 1}}, Service)
+    other = c.to_model({"name": "a", "plugins": ["x", "y"], "options": {"a": 1}}, Service)
+
+    assert {m: 1}[other] == 1
+    assert hash(m) != hash(c.to_model({"name": "a", "plugins": ["y", "x"]}, Service))
+
+
+def test_collected_classes():
+    cls = dataclasses.make_dataclass("Dynamic", [("value", int)])
+    compact_class(cls)(value=1)
+    ref = weakref.ref(cls)
+
+    del cls
+    gc.collect()
+    assert ref() is None
+
+
+def test_classes():
+    cls = compact_class(Tenant)
+
+    assert compact_class(Tenant) is cls
+    assert compact_class(cls) is cls
+    assert origin_class(cls) is Tenant
+    assert origin_class(Tenant) is Tenant
+    assert cls(name="a") == cls(name="a", retry=Retry(), tags=())
+    assert sys.getsizeof(cls(name="a")) < sys.getsizeof(Tenant(name="a")) + sys.getsizeof(Tenant(name="a").__dict__)
+
+
+def test_pickle():
+    m = create_config().to_model({"name": "a", "tags": ["x"]}, Tenant)
+    assert pickle.loads(pickle.dumps(m)) == m
+
+
+def test_update():
+    c = create_config()
+    old_data = {"name": "a", "retry": {"count": 1}}
+    m = c.to_model(old_data, Tenant)
+
+    updated = c.update(m, old_data, {"name": "b", "retry": {"count": 1}})
+    assert updated.name == "b"
+    assert updated.retry is m.retry
+
+
+def test_lazy():
+    with pytest.raises(ValueError):
+        create_config(lazy=True)
+
+
+@dataclasses.dataclass
+class Normalized:
+    name: str
+
+    def __post_init__(self):
+        self.name = self.name.lower()
+
+
+@dataclasses.dataclass
+class Base:
+    name: str
+
+    def validate(self):
+        assert self.name, "Empty name"
+
+
+@dataclasses.dataclass
+class Child(Base):
+    count: int = 0
+
+    def validate(self):
+        super().validate()
+        assert self.count >= 0, "Negative count"
+
+    @property
+    def label(self):
+        return f"{self.name}:{self.count}"
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"compiled": False}, {"codegen": True}])
+def test_post_init(kwargs):
+    m = create_config(**kwargs).to_model({"name": "ABC"}, Normalized)
+
+    assert m.name == "abc"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        m.name = "b"
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"compiled": False}, {"codegen": True}])
+def test_inheritance(kwargs):
+    c = create_config(**kwargs)
+
+    m = c.to_model({"name": "a", "count": 1}, Child)
+    assert isinstance(m, compact_class(Base))
+    assert m.label == "a:1"
+    assert not hasattr(m, "__dict__")
+
+    with pytest.raises(ValueError, match="Empty name"):
+        c.to_model({"name": "", "count": 1}, Child)
+    with pytest.raises(ValueError, match="Negative count"):
+        c.to_model({"name": "a", "count": -1}, Child)
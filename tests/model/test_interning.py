@@ -0,0 +1,118 @@
+import dataclasses
+import gc
+import pathlib
+import sys
+import typing
+
+import pytest
+
+from glorpen.config.fields.simple import CollectionTypes, PathType, SimpleTypes, UnionType
+from glorpen.config.model.compact import compact_class
+from glorpen.config.model.interning import InternPool
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import Transformer
+
+
+@dataclasses.dataclass(frozen=True)
+class Retry:
+    count: int
+    backoff: str
+
+
+@dataclasses.dataclass
+class Endpoint:
+    url: str
+    retry: Retry
+    tags: typing.Tuple[str, ...] = ()
+    path: typing.Optional[pathlib.Path] = None
+
+
+def create_config(**kwargs):
+    return Transformer(
+        schema=Schema(), types=[UnionType, SimpleTypes, CollectionTypes, PathType], interning=True, **kwargs
+    )
+
+
+def create_data():
+    # build strings at runtime so they are not shared constants
+    return {
+        "url": "".join(["http://", "example"]),
+        "retry": {"count": 3, "backoff": "".join(["expo", "nential"])},
+        "tags": ["".join(["a", "b"])],
+        "path": "/tmp/a",
+    }
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"compiled": False}, {"codegen": True}])
+def test_shared_values(kwargs):
+    c = create_config(**kwargs)
+
+    first = c.to_model(create_data(), Endpoint)
+    second = c.to_model(create_data(), Endpoint)
+
+    assert first is not second
+    assert first.url is second.url
+    assert first.retry is second.retry
+    assert first.tags is second.tags
+    assert first.path is second.path
+    assert c.intern_pool.info().saved > 0
+
+
+def test_compact_models():
+    c = create_config(compact=True)
+
+    first = c.to_model(create_data(), Endpoint)
+    second = c.to_model(create_data(), Endpoint)
+
+    assert type(first) is compact_class(Endpoint)
+    assert first is second
+
+
+def test_weak_models():
+    pool = InternPool()
+    value = pool.intern(Retry(1, "a"))
+    assert pool.intern(Retry(1, "a")) is value
+
+    del value
+    gc.collect()
+    assert pool.info().currsize == 0
+
+
+def test_saved():
+    pool = InternPool()
+    value = tuple([1, 2])
+    duplicate = tuple([1, 2])
+
+    assert pool.intern(value) is value
+    assert pool.intern(duplicate) is value
+    assert pool.info() == (1, 1, sys.getsizeof(duplicate), 1)
+
+
+@dataclasses.dataclass(frozen=True)
+class Setting:
+    value: typing.Any
+
+
+def test_typed_keys():
+    pool = InternPool()
+
+    assert type(pool.intern((1, (2,)))[1][0]) is int
+    assert type(pool.intern((True, (2,)))[0]) is bool
+    assert type(pool.intern((1, (2.0,)))[1][0]) is float
+    pool.intern(frozenset([1]))
+    assert type(next(iter(pool.intern(frozenset([1.0]))))) is float
+
+    one = pool.intern(Setting(1))
+    pair = pool.intern(Setting((1,)))
+    assert type(pool.intern(Setting(True)).value) is bool
+    assert type(pool.intern(Setting((1.0,))).value[0]) is float
+    assert pool.intern(Setting(1)) is one and pool.intern(Setting((1,))) is pair
+
+
+def test_shared_pool():
+    pool = InternPool()
+    first = Transformer(schema=Schema(), types=[SimpleTypes], interning=pool)
+    second = Transformer(schema=Schema(), types=[SimpleTypes], interning=pool)
+
+    assert first.to_model(create_data()["retry"], Retry) is second.to_model(create_data()["retry"], Retry)
+    assert first.intern_pool is pool
@@ -0,0 +1,59 @@
+import dataclasses
+
+import pytest
+
+from glorpen.config.fields.simple import SimpleTypes
+from glorpen.config.model.interpolation import interpolate, parse
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import Transformer
+
+
+def test_parse():
+    template = parse("{{ a.b }}/cache/{{c}}")
+    assert [getattr(s, "path", s) for s in template.segments] == [("a", "b"), "/cache/", ("c",)]
+    assert parse("{{ a.b }}/cache/{{c}}") is template
+    assert parse("no references") is None
+
+
+def test_interpolate():
+    data = {
+        "project": {"path": "{{ base }}/project", "cache_path": "{{ project.path }}/cache"},
+        "base": "/tmp",
+        "port": 80,
+        "items": ["{{ port }}", "{{ items.0 }}:{{ port }}"],
+        "copy": "{{ project }}",
+    }
+
+    assert interpolate(data) == {
+        "project": {"path": "/tmp/project", "cache_path": "/tmp/project/cache"},
+        "base": "/tmp",
+        "port": 80,
+        "items": [80, "80:80"],
+        "copy": {"path": "/tmp/project", "cache_path": "/tmp/project/cache"},
+    }
+    assert data["project"]["path"] == "{{ base }}/project", "input is not modified"
+
+
+def test_unchanged_data_is_shared():
+    data = {"a": {"b": 1}, "c": "{{ a.b }}"}
+    assert interpolate(data)["a"] is data["a"]
+
+
+@pytest.mark.parametrize("data,message", [
+    ({"a": "{{ b }}", "b": "{{ a }}"}, "Interpolation cycle: a -> b -> a"),
+    ({"a": {"b": "{{ a }}"}}, "Interpolation cycle: a.b -> a.b"),
+    ({"a": "{{ missing.value }}"}, "Unknown reference 'missing.value' in a"),
+])
+def test_errors(data, message):
+    with pytest.raises(ValueError, match=message):
+        interpolate(data)
+
+
+def test_transformer():
+    @dataclasses.dataclass
+    class Config:
+        path: str
+        cache_path: str
+
+    t = Transformer(Schema(), types=[SimpleTypes], interpolation=True)
+    assert t.to_model({"path": "/tmp", "cache_path": "{{ path }}/cache"}, Config).cache_path == "/tmp/cache"
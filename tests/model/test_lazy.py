@@ -0,0 +1,84 @@
+import dataclasses
+import pickle
+import typing
+
+import pytest
+
+from glorpen.config.fields.simple import SimpleTypes
+from glorpen.config.model.lazy import Thunk, materialize
+from glorpen.config.model.schema import Schema
+from glorpen.config.model.transformer import ConfigValueError, Transformer
+from glorpen.config.validation import Validator
+
+
+@dataclasses.dataclass
+class Section:
+    value: int
+
+    def validate(self):
+        assert self.value >= 0, "Negative value"
+
+
+@dataclasses.dataclass
+class Root:
+    section: Section
+    items: list = dataclasses.field(default_factory=list)
+    optional: typing.Optional[Section] = None
+
+
+def create_config(codegen=False):
+    t = Transformer(schema=Schema(), validator=Validator(), types=[SimpleTypes], lazy=True, codegen=codegen)
+    t.lazy_collection_size = 2
+    return t
+
+
+@pytest.mark.parametrize("codegen", [True, False])
+def test_converted_on_access(codegen):
+    m = create_config(codegen).to_model({"section": {"value": "1"}, "items": [1, 2, 3]}, Root)
+
+    assert isinstance(m, Root)
+    assert isinstance(m.__dict__["section"], Thunk)
+    assert isinstance(m.__dict__["items"], Thunk)
+    assert m.optional is None
+
+    assert m.section == Section(value=1)
+    assert m.section is m.section
+    assert m.items == [1, 2, 3]
+
+
+def test_small_collections_are_eager():
+    m = create_config().to_model({"section": {"value": 1}, "items": [1]}, Root)
+    assert m.__dict__["items"] == [1]
+
+
+def test_unsized_collections_are_eager():
+    m = create_config().to_model({"section": {"value": 1}, "items": (i for i in range(3))}, Root)
+    assert m.__dict__["items"] == [0, 1, 2]
+
+    with pytest.raises(ValueError, match="items"):
+        create_config().to_model({"section": {"value": 1}, "items": 5}, Root)
+
+
+def test_errors_on_access():
+    m = create_config().to_model({"section": {"value": -1}}, Root)
+
+    with pytest.raises(ConfigValueError, match="section: Negative value"):
+        m.section
+
+
+def test_materialize():
+    m = create_config().to_model({"section": {"value": "a"}}, Root)
+
+    with pytest.raises(ConfigValueError, match="section: value: invalid literal"):
+        materialize(m)
+
+
+@pytest.mark.parametrize("codegen", [True, False])
+def test_pickle(codegen):
+    m = create_config(codegen).to_model({"section": {"value": "1"}, "items": [1, 2, 3]}, Root)
+
+    restored = pickle.loads(pickle.dumps(m))
+    assert type(restored) is Root
+    assert restored == Root(section=Section(value=1), items=[1, 2, 3])
+
+    assert pickle.loads(pickle.dumps(materialize(m))) == restored
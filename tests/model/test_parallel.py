@@ -0,0 +1,29 @@
+import dataclasses
+import pickle
+
+from glorpen.config import default
+from glorpen.config.model.parallel import map_models
+from glorpen.config.model.transformer import CollectionValueError, ConfigValueError
+
+
+@dataclasses.dataclass
+class Item:
+    value: int
+
+
+def test_errors_are_picklable():
+    e = pickle.loads(pickle.dumps(ConfigValueError(CollectionValueError({"value": ValueError("Bad value")}))))
+    assert str(e) == "Found validation errors:\nvalue: Bad value"
+
+
+def test_map_models():
+    items = [{"value": i} for i in range(10)]
+    items[3] = {"value": "a"}
+    items[5] = "value"
+
+    results = map_models(default, items, Item, chunk_size=3, max_workers=2)
+
+    assert len(results) == 10
+    assert isinstance(results[3], ConfigValueError)
+    assert isinstance(results[5], ConfigValueError)
+    assert [r.value for i, r in enumerate(results) if i not in (3, 5)] == [0, 1, 2, 4, 6, 7, 8, 9]
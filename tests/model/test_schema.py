@@ -1,7 +1,10 @@
 import dataclasses
+import gc
 import typing
+import weakref
 
-from glorpen.config.model.schema import Schema
+from glorpen.config import default
+from glorpen.config.model.schema import Options, Schema
 
 
 @dataclasses.dataclass
@@ -27,6 +30,15 @@ def test_options_are_inherited_only_by_types():
     assert p.args['a_field'].args[1].args["a_field"].options == {}
 
 
+def test_annotated_options():
+    s = Schema()
+    p = s.generate(typing.Annotated[typing.List[int], Options(min=0), "ignored"], {"max": 2})
+
+    assert p.type is list
+    assert p.options == {"min": 0, "max": 2}
+    assert s.generate(typing.Annotated[typing.List[int], Options(min=0), "ignored"], {"max": 2}) is p
+
+
 def test_optionals():
     @dataclasses.dataclass
     class Dummy:
@@ -41,3 +53,76 @@ def test_optionals():
     assert not p.args["required_field"].is_optional()
     assert p.args["optional_field"].is_optional()
     assert p.args["optional_literal_field"].is_optional()
+
+
+class TestCache:
+    def test_hits(self):
+        s = Schema()
+
+        assert s.generate(Dummy) is s.generate(Dummy)
+        assert s.generate(str, {"opt": [1]}) is s.generate(str, {"opt": [1]})
+        assert s.generate(str, {"opt": [1]}) is not s.generate(str, {"opt": (1,)})
+        assert s.cache_info().hits == 3
+        assert s.cache_info().misses == 3
+
+    def test_unhashable_options(self):
+        s = Schema()
+        p = s.generate(str, {"opt": object.__new__(type("Unhashable", (), {"__hash__": None}))})
+        assert p.type is str
+        assert s.cache_info().currsize == 0
+
+    def test_lru(self):
+        s = Schema(cache_size=2)
+
+        p = s.generate(int)
+        s.generate(str)
+        s.generate(int)
+        s.generate(float)
+
+        assert s.generate(int) is p
+        assert s.cache_info().currsize == 2
+
+    def test_disabled(self):
+        s = Schema(cache_size=0)
+        assert s.generate(Dummy) is not s.generate(Dummy)
+        assert s.cache_info() is None
+
+    def test_collected_types(self):
+        s = Schema(cache_size=1)
+
+        cls = dataclasses.make_dataclass("Dynamic", [("a_field", str)])
+        ref = weakref.ref(cls)
+        assert s.generate(cls) is s.generate(cls)
+        assert s.cache_info().currsize == 1
+        del cls
+        gc.collect()
+
+        assert ref() is None
+        assert s.cache_info().currsize == 0
+
+    def test_collected_converted_types(self):
+        c = default()
+
+        cls = dataclasses.make_dataclass("Dynamic", [("a_field", str), ("items", typing.List[int])])
+        ref = weakref.ref(cls)
+        assert c.to_model({"a_field": "a", "items": [1]}, cls).items == [1]
+        del cls
+        gc.collect()
+
+        assert ref() is None
+
+    def test_aliases(self):
+        s = Schema()
+
+        assert s.generate(list[int]) is s.generate(list[int])
+        assert s.generate(typing.Optional[int]) is s.generate(typing.Optional[int])
+        assert s.cache_info().hits == 2
+
+    def test_clear(self):
+        s = Schema()
+        s.generate(Dummy)
+        s.generate(list[int])
+
+        s.cache_clear()
+        assert s.cache_info().currsize == 0
+        assert Dummy.__dict__["__glorpen_type_cache__"].get(s._cache) is None
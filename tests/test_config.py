@@ -1,16 +1,19 @@
 import dataclasses
+import pathlib
 import typing
 
 import pytest
 
-from glorpen.config.fields.simple import SimpleTypes
+from glorpen.config.fields.simple import CollectionTypes, PathType, SimpleTypes, UnionType
 from glorpen.config.model.schema import Schema
-from glorpen.config.model.transformer import Transformer
+from glorpen.config.model.transformer import (
+    CollectionValueError, ConfigType, ConfigValueError, LazyType, Transformer, iter_errors
+)
 from glorpen.config.validation import Validator
 
 
-def create_config(types=None):
-    return Transformer(schema=Schema(), validator=Validator(), types=types)
+def create_config(types=None, compiled=True, codegen=False):
+    return Transformer(schema=Schema(), validator=Validator(), types=types, compiled=compiled, codegen=codegen)
 
 
 def test_default_import():
@@ -87,3 +90,242 @@ class TestConfig:
 
         with pytest.raises(ValueError, match="Bad value"):
             c.to_model({}, Data)
+
+
+@dataclasses.dataclass
+class Nested:
+    value: int
+    items: typing.Tuple[str, typing.Union[int, str]] = ("a", 1)
+
+
+@dataclasses.dataclass
+class Root:
+    name: str
+    nested: Nested
+    optional: typing.Optional[Nested] = None
+
+
+class TestCompiled:
+    @classmethod
+    def convert(cls, data, compiled, codegen=False):
+        c = create_config([SimpleTypes, CollectionTypes, UnionType], compiled=compiled, codegen=codegen)
+        try:
+            return c.to_model(data, Root)
+        except ValueError as e:
+            return str(e)
+
+    @pytest.mark.parametrize("data", [
+        {"name": "root", "nested": {"value": "1", "items": ["b", "2"]}},
+        {"name": "root", "nested": {"value": "1"}, "optional": {"value": 2}},
+        {"name": "root", "nested": {"value": "a", "items": ["b", 2, 3]}, "extra": 1},
+        {"nested": {"items": ["b"]}},
+    ])
+    def test_same_as_interpreted(self, data):
+        assert self.convert(data, True) == self.convert(data, False)
+        assert self.convert(data, True, codegen=True) == self.convert(data, False)
+
+    def test_plan_is_reused(self):
+        c = create_config([SimpleTypes])
+        c.to_model({"value": 1}, Nested)
+        c.to_model({"value": 2}, Nested)
+        assert c._plans.info().hits == 1
+
+    def test_register_type_resets_plans(self):
+        c = create_config()
+        with pytest.raises(ValueError, match="Could not convert to"):
+            c.to_model("1", int)
+        c.register_type(SimpleTypes)
+        assert c.to_model("1", int) == 1
+
+
+class TestDispatch:
+    class ProbedType(ConfigType):
+        def to_model(self, data, model):
+            if model.type is bytes:
+                return data.encode()
+
+    def test_declared_types_are_indexed(self):
+        c = create_config([SimpleTypes, UnionType])
+
+        assert [type(t) for t in c._types_for(int)] == [SimpleTypes]
+        assert [type(t) for t in c._types_for(typing.Union)] == [UnionType]
+        assert c._types_for(bytes) == ()
+
+    def test_subclasses(self):
+        c = create_config([PathType])
+        assert [type(t) for t in c._types_for(pathlib.PurePosixPath)] == []
+        assert [type(t) for t in c._types_for(pathlib.PosixPath)] == [PathType]
+
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_undeclared_types_are_probed(self, compiled):
+        c = create_config([SimpleTypes, self.ProbedType], compiled=compiled)
+
+        assert [type(t) for t in c._types_for(int)] == [self.ProbedType, SimpleTypes]
+        assert c.to_model("abc", bytes) == b"abc"
+        assert c.to_model("1", int) == 1
+
+    def test_lazy_types(self):
+        c = create_config([SimpleTypes])
+        c.register_lazy_type("glorpen.config.fields.simple:PathType", ["pathlib.Path"])
+        c.register_lazy_type("glorpen.config.fields.simple:BooleanType", [bool])
+
+        assert [type(t) for t in c._types_for(int)] == [SimpleTypes]
+        assert all(isinstance(t, LazyType) for t in c._registered_types[:2])
+
+        assert c.to_model("/a", pathlib.PosixPath) == pathlib.Path("/a")
+        assert [type(t) for t in c._registered_types] == [LazyType, PathType, SimpleTypes]
+        assert c.to_model("yes", bool) is True
+
+
+class TestCodegen:
+    def test_defaults_and_validation(self):
+        c = create_config([SimpleTypes], codegen=True)
+
+        @dataclasses.dataclass
+        class Data:
+            data: str
+            factory_field: list = dataclasses.field(default_factory=list)
+            optional_field: typing.Optional[str] = "default-value"
+
+            def validate(self):
+                assert self.data != "invalid", "Bad value"
+
+        m = c.to_model({"data": 1}, Data)
+        assert m == Data(data="1", factory_field=[], optional_field=None)
+        assert m.factory_field is not c.to_model({"data": 1}, Data).factory_field
+
+        with pytest.raises(ValueError, match="Bad value"):
+            c.to_model({"data": "invalid"}, Data)
+
+
+class TestIterModels:
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_iter(self, compiled):
+        c = create_config([SimpleTypes], compiled=compiled)
+        items = c.iter_models(iter([{"value": "1"}, {"value": 2}]), Nested)
+
+        assert next(items) == Nested(value=1)
+        assert list(items) == [Nested(value=2)]
+
+    def test_raises(self):
+        c = create_config([SimpleTypes])
+        items = c.iter_models([{"value": "a"}, {"value": 2}], Nested)
+
+        with pytest.raises(ConfigValueError, match="invalid literal"):
+            list(items)
+
+    def test_with_errors(self):
+        c = create_config([SimpleTypes])
+        items = list(c.iter_models([{"value": 1}, {"value": "a"}, {"value": 3}], Nested, with_errors=True))
+
+        assert items[0] == (0, Nested(value=1))
+        assert items[1][0] == 1 and isinstance(items[1][1], ConfigValueError)
+        assert items[2] == (2, Nested(value=3))
+
+    @pytest.mark.parametrize("options", [{"compiled": False}, {"compiled": True}, {"codegen": True}])
+    def test_with_invalid_records(self, options):
+        c = create_config([SimpleTypes], **options)
+        items = list(c.iter_models([{"value": 1}, 5, ["value"]], Nested, with_errors=True))
+
+        assert items[0] == (0, Nested(value=1))
+        assert isinstance(items[1][1], ConfigValueError) and "Expected mapping, got int" in str(items[1][1])
+        assert isinstance(items[2][1], ConfigValueError)
+
+
+@dataclasses.dataclass
+class Section:
+    value: int
+
+    def validate(self):
+        assert self.value >= 0, "Negative value"
+
+
+@dataclasses.dataclass
+class Sections:
+    first: Section
+    second: Section
+    name: str = "name"
+
+
+@dataclasses.dataclass
+class Raw:
+    value: typing.Any
+    items: list
+
+
+class TestUpdate:
+    @pytest.mark.parametrize("compiled", [True, False])
+    def test_reuses_unchanged(self, compiled):
+        c = create_config([SimpleTypes], compiled=compiled)
+        old_data = {"first": {"value": 1}, "second": {"value": 2}}
+        new_data = {"first": {"value": 1}, "second": {"value": "3"}, "name": "other"}
+
+        old = c.to_model(old_data, Sections)
+        new = c.update(old, old_data, new_data)
+
+        assert new == Sections(first=Section(1), second=Section(3), name="other")
+        assert new.first is old.first
+        assert c.update(new, new_data, new_data) is new
+
+    def test_errors(self):
+        c = create_config([SimpleTypes])
+        old_data = {"first": {"value": 1}, "second": {"value": 2}}
+
+        old = c.to_model(old_data, Sections)
+        with pytest.raises(ConfigValueError, match="second: Negative value"):
+            c.update(old, old_data, {"first": {"value": 1}, "second": {"value": -1}})
+        with pytest.raises(ConfigValueError, match="extra: Extra field"):
+            c.update(old, old_data, {"first": {"value": 1}, "second": {"value": 2}, "extra": 1})
+
+    def test_compares_types(self):
+        c = create_config([SimpleTypes])
+        old_data = {"value": 1, "items": [1, True]}
+        new_data = {"value": 1.0, "items": [True, 1]}
+
+        new = c.update(c.to_model(old_data, Raw), old_data, new_data)
+        assert type(new.value) is float
+        assert [type(i) for i in new.items] == [bool, int]
+
+
+@dataclasses.dataclass
+class Many:
+    items: typing.Tuple[int, int, int, int]
+    choice: typing.Union[int, float] = 0
+    name: str = "name"
+
+
+class TestErrorLimits:
+    data = {"items": ["a", "b", "c", "d"], "choice": "x", "extra": 1}
+
+    def test_lazy_formatting(self):
+        e = CollectionValueError({"a": ValueError("Bad value")})
+        assert e.items["a"].args == ("Bad value",)
+        assert str(e) == "a: Bad value"
+
+    @pytest.mark.parametrize("codegen", [True, False])
+    def test_fail_fast(self, codegen):
+        c = Transformer(Schema(), types=[SimpleTypes, CollectionTypes, UnionType], fail_fast=True, codegen=codegen)
+
+        with pytest.raises(ConfigValueError) as e:
+            c.to_model(self.data, Many)
+
+        assert [p for p, _ in iter_errors(e.value)] == [("items", 0)]
+        assert str(e.value).endswith("(error limit reached)\n(error limit reached)")
+
+    @pytest.mark.parametrize("limit,paths", [
+        (5, [("items", 0), ("items", 1), ("items", 2), ("items", 3), ("choice",)]),
+        (6, [("items", 0), ("items", 1), ("items", 2), ("items", 3), ("choice",), ("extra",)]),
+        (7, [("items", 0), ("items", 1), ("items", 2), ("items", 3), ("choice",), ("extra",)]),
+    ])
+    def test_max_errors(self, limit, paths):
+        c = Transformer(Schema(), types=[SimpleTypes, CollectionTypes, UnionType], max_errors=limit)
+
+        with pytest.raises(ConfigValueError) as e:
+            c.to_model(self.data, Many)
+
+        assert [p for p, _ in iter_errors(e.value)] == paths
+        assert e.value.error.truncated is (limit < 7)
+
+    def test_union_members_are_not_counted(self):
+        c = Transformer(Schema(), types=[SimpleTypes, CollectionTypes, UnionType], fail_fast=True)
+        assert c.to_model({"items": [1, 2, 3, 4], "choice": "1.5"}, Many).choice == 1.5
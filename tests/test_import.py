@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+# microseconds, cumulative import time reported by ``python -X importtime``, currently about 60ms
+IMPORT_TIME_LIMIT = 150_000
+
+HEAVY_MODULES = ("asyncio", "concurrent.futures", "logging", "semver", "pathlib", "glorpen.config.fields")
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def test_import_time():
+    stderr = run_python("-X", "importtime", "-c", "import glorpen.config").stderr
+
+    # lines are "import time: <self> | <cumulative> | <indented module name>"
+    times = {}
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name] = int(cumulative)
+
+    assert times[" glorpen.config"] < IMPORT_TIME_LIMIT
+
+
+def test_no_heavy_imports():
+    code = "\n".join([
+        "import sys, dataclasses",
+        "loaded = set(sys.modules)",
+        "import glorpen.config",
+        "config = glorpen.config.default()",
+        "print('\\n'.join(set(sys.modules) - loaded))",
+        "print('---')",
+        # records import attempts, also of modules which are not installed
+        "attempted = []",
+        "sys.meta_path.insert(0, type('Finder', (), {'find_spec': lambda name, *args: attempted.append(name)}))",
+        "Model = dataclasses.make_dataclass('Model', [('values', list)])",
+        "config.to_model({'values': [1, 2]}, Model)",
+        "print('\\n'.join(attempted))",
+    ])
+    imported, _, converted = run_python("-c", code).stdout.partition("---")
+
+    assert [m for m in imported.split() if m.startswith(HEAVY_MODULES)] == []
+    assert "glorpen.config.fields.array" in converted.split()
+    assert [m for m in converted.split() if m.startswith(("numpy", "asyncio", "concurrent.futures"))] == []
@@ -0,0 +1,47 @@
+import abc
+
+import pytest
+
+from glorpen.config.validation import Validator
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+class Marker(abc.ABC):
+    pass
+
+
+Marker.register(Child)
+
+
+def test_registered_validators():
+    calls = []
+    v = Validator()
+    v.register_validator(Child, lambda m: calls.append("child"))
+    v.register_validator(Base, lambda m: calls.append("base"))
+    v.register_validator(Marker, lambda m: calls.append("marker"))
+
+    v.validate(Child())
+    assert calls == ["base", "child", "marker"]
+
+    calls.clear()
+    v.validate(Base())
+    assert calls == ["base"]
+
+
+def test_cache_is_reset_on_register():
+    def check(model):
+        assert False, "Bad value"
+
+    v = Validator()
+    v.validate(Child())
+
+    v.register_validator(Base, check)
+    with pytest.raises(ValueError, match="Bad value"):
+        v.validate(Child())
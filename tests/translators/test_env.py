@@ -0,0 +1,55 @@
+import dataclasses
+import typing
+
+import pytest
+
+from glorpen.config import default
+from glorpen.config.model.schema import Schema
+from glorpen.config.translators.env import EnvironmentReader
+
+
+@dataclasses.dataclass
+class Database:
+    poolSize: int = 1
+    debug: bool = False
+
+
+@dataclasses.dataclass
+class Config:
+    database: Database
+    name: str = "app"
+    replica: typing.Optional[Database] = None
+
+
+def create_reader(environ):
+    return EnvironmentReader(Schema().generate(Config), "APP", environ=environ)
+
+
+def test_read():
+    r = create_reader({
+        "APP__DATABASE__POOLSIZE": "5",
+        "APP__DATABASE__DEBUG": "yes",
+        "APP__NAME": "test",
+        "OTHER__NAME": "other",
+    })
+
+    data = r.read()
+    assert data == {"database": {"poolSize": "5", "debug": "yes"}, "name": "test"}
+    assert default().to_model(data, Config) == Config(database=Database(poolSize=5, debug=True), name="test")
+
+
+def test_optional_sections():
+    data = create_reader({"APP__REPLICA__POOLSIZE": "5", "APP__DATABASE__DEBUG": "1"}).read()
+
+    assert data == {"replica": {"poolSize": "5"}, "database": {"debug": "1"}}
+    assert default().to_model(data, Config).replica == Database(poolSize=5)
+
+
+def test_unknown_names():
+    with pytest.raises(ValueError, match="typo: Extra field"):
+        default().to_model(create_reader({"APP__DATABASE__TYPO": "1"}).read(), Config)
+
+
+def test_conflicts():
+    with pytest.raises(ValueError, match="conflicts"):
+        create_reader({"APP__DATABASE": "a", "APP__DATABASE__DEBUG": "1"}).read()
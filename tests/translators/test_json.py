@@ -0,0 +1,51 @@
+import io
+
+import pytest
+
+from glorpen.config.translators import json as json_translator
+from glorpen.config.translators.json import JsonReader
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(json_translator, "orjson", None)
+    JsonReader.clear_cache()
+    return request.param
+
+
+class TestReader:
+    def test_file_is_cached(self, backend, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_bytes('{"a": [1, 2], "b": "zażółć"}'.encode())
+
+        data = JsonReader(path).read()
+        assert data == {"a": [1, 2], "b": "zażółć"}
+        assert JsonReader(path).read() is data
+
+    def test_cache_size(self, backend, tmp_path, monkeypatch):
+        monkeypatch.setattr(JsonReader, "cache_size", 2)
+        paths = [tmp_path / f"config{i}.json" for i in range(3)]
+        for path in paths:
+            path.write_bytes(b'{"a": 1}')
+
+        first, second = JsonReader(paths[0]).read(), JsonReader(paths[1]).read()
+        assert JsonReader(paths[0]).read() is first
+        JsonReader(paths[2]).read()
+
+        assert JsonReader(paths[0]).read() is first
+        assert JsonReader(paths[1]).read() is not second
+
+        monkeypatch.setattr(JsonReader, "cache_size", 0)
+        JsonReader.clear_cache()
+        assert JsonReader(paths[0]).read() is not JsonReader(paths[0]).read()
+
+    def test_empty_file(self, backend, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_bytes(b"")
+
+        with pytest.raises(ValueError):
+            JsonReader(path).read()
+
+    def test_stream(self, backend):
+        assert JsonReader(io.BytesIO(b'{"a": 1}')).read() == {"a": 1}
@@ -0,0 +1,65 @@
+import dataclasses
+import typing
+
+import pytest
+
+from glorpen.config import default
+from glorpen.config.translators.layered import LayeredReader
+from glorpen.config.translators.yaml import YamlReader
+
+
+@dataclasses.dataclass
+class Database:
+    host: str
+    pool_size: int = 1
+
+
+@dataclasses.dataclass
+class Config:
+    database: Database
+    plugins: typing.List[str] = dataclasses.field(default_factory=list)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    (tmp_path / "base.yaml").write_text("database:\n  host: localhost\n  pool_size: 2\nplugins: [a]\n")
+    (tmp_path / "prod.json").write_text('{"database": {"host": "db"}}')
+    conf_d = tmp_path / "conf.d"
+    conf_d.mkdir()
+    (conf_d / "20-plugins.toml").write_text('plugins = ["c"]\n')
+    (conf_d / "10-plugins.yaml").write_text("plugins: [b]\n")
+    (conf_d / "README").write_text("ignored")
+    return tmp_path
+
+
+def test_merge(sources):
+    base = YamlReader(sources / "base.yaml")
+    r = LayeredReader(sources / "base.yaml", sources / "prod.json", sources / "conf.d")
+
+    assert r.read() == {"database": {"host": "db", "pool_size": 2}, "plugins": ["c"]}
+    assert base.read() == {"database": {"host": "localhost", "pool_size": 2}, "plugins": ["a"]}, "source is not modified"
+
+    assert r.source_of(("database", "host")) == str(sources / "prod.json")
+    assert r.source_of(("database", "pool_size")) == str(sources / "base.yaml")
+    assert r.source_of(("plugins", 0)) == str(sources / "conf.d" / "20-plugins.toml")
+
+
+def test_empty_fragments(sources):
+    (sources / "conf.d" / "15-off.yaml").write_text("# disabled\n")
+    (sources / "conf.d" / "16-empty.yaml").write_text("")
+    r = LayeredReader(sources / "base.yaml", sources / "conf.d")
+
+    assert r.read() == {"database": {"host": "localhost", "pool_size": 2}, "plugins": ["c"]}
+    assert LayeredReader(sources / "conf.d" / "15-off.yaml").read() is None
+
+
+def test_explain(sources):
+    (sources / "conf.d" / "30-broken.yaml").write_text("database:\n  pool_size: many\n")
+    r = LayeredReader(sources / "base.yaml", sources / "conf.d")
+
+    with pytest.raises(ValueError) as e:
+        default().to_model(r.read(), Config)
+
+    [(path, source, error)] = r.explain(e.value)
+    assert path == ("database", "pool_size")
+    assert source == str(sources / "conf.d" / "30-broken.yaml")
@@ -0,0 +1,54 @@
+import dataclasses
+import io
+import typing
+
+from glorpen.config import Schema
+from glorpen.config.translators.toml import TomlReader, TomlRenderer
+
+
+def render(cls):
+    r = TomlRenderer()
+    model = Schema().generate(cls)
+    return r.render(model)
+
+
+def test_render():
+    @dataclasses.dataclass
+    class Section:
+        """section doc"""
+        path: str = "/tmp"
+
+    @dataclasses.dataclass
+    class Dummy:
+        section: Section
+        required_field: str = dataclasses.field(metadata={"doc": "some string value"})
+        nullable_field: typing.Optional[str]
+        none_field: typing.Optional[int] = None
+        number_field: typing.Optional[int] = 5
+        optional_field: typing.List[int] = dataclasses.field(default_factory=lambda: [1, 2])
+        flag: bool = True
+
+    assert render(Dummy) == """# some string value
+required_field = # required str
+# nullable_field = # optional
+# none_field = # optional
+# number_field = 5
+# optional_field = [1, 2]
+# flag = true
+
+[section]
+# path = "/tmp"
+"""
+
+
+class TestReader:
+    def test_file_is_cached(self, tmp_path):
+        path = tmp_path / "config.toml"
+        path.write_text("a = 1\n[b]\nc = \"d\"\n")
+
+        data = TomlReader(path).read()
+        assert data == {"a": 1, "b": {"c": "d"}}
+        assert TomlReader(path).read() is data
+
+    def test_stream(self):
+        assert TomlReader(io.BytesIO(b"a = [1, 2]\n")).read() == {"a": [1, 2]}
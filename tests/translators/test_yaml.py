@@ -1,8 +1,9 @@
 import dataclasses
+import io
 import typing
 
 from glorpen.config import Schema
-from glorpen.config.translators.yaml import YamlRenderer
+from glorpen.config.translators.yaml import YamlReader, YamlRenderer
 
 
 def render(cls):
@@ -55,3 +56,19 @@ def test_nested_fields():
         field: Dummy2
 
     assert render(Dummy1) == "field:\n  field: # required str\n"
+
+
+class TestReader:
+    def test_file_is_cached(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("a: 1\n")
+
+        data = YamlReader(str(path)).read()
+        assert data == {"a": 1}
+        assert YamlReader(path).read() is data
+
+        path.write_text("a: 22\n")
+        assert YamlReader(path).read() == {"a": 22}
+
+    def test_stream(self):
+        assert YamlReader(io.BytesIO(b"a: [1, 2]\n")).read() == {"a": [1, 2]}